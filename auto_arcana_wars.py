@@ -1,33 +1,41 @@
 from pathlib import Path
-from typing import List
+from typing import Callable, List
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat, chain
+import os
+import numpy as np
 
-from maxxer_bot import MaxxerBot
+from maxxer_bot import WarriorMaxxerBot, MageMaxxerBot, NinjaMaxxerBot
 from ordering_bot import HeadOnBot
 from your_bot import YourBot
 from random_bot import RandomBot
+from bot_utils import BaseBot, preload_team_data
 from backend import play_round
 from utils import RngEngine
+from jit_utils import njit
 import warnings
-from functools import partial
 
 N_ROUNDS = 5
 N_WINS = 3
 
 BOT_MAPPING = {
     "random": RandomBot,
-    "warrior_maxxer": partial(MaxxerBot, character_to_max="warrior"),
-    "mage_maxxer": partial(MaxxerBot, character_to_max="mage"),
-    "ninja_maxxer": partial(MaxxerBot, character_to_max="ninja"),
+    "warrior_maxxer": WarriorMaxxerBot,
+    "mage_maxxer": MageMaxxerBot,
+    "ninja_maxxer": NinjaMaxxerBot,
     "head_on": HeadOnBot,
     "your_bot": YourBot, # uncomment when implemented
 }
 
 DEFAULT_STARTING_ELO = 1800
 
-current_elo = {bot: DEFAULT_STARTING_ELO for bot in BOT_MAPPING}
+# the elo of each bot is stored in current_elo at the index given by BOT_IDS
+BOT_IDS = {bot: bot_id for bot_id, bot in enumerate(BOT_MAPPING)}
+current_elo = np.full(len(BOT_MAPPING), DEFAULT_STARTING_ELO, dtype=np.int32)
 
 
-def calculate_elo(your_elo: int, opponent_elo: int, is_your_win: bool) -> list[int]:
+@njit(cache=True)
+def calculate_elo(your_elo: int, opponent_elo: int, is_your_win: bool) -> tuple[int, int]:
     """
 	Calculates the updated Elo ratings for you and your opponent based on the match outcome.
 
@@ -40,8 +48,8 @@ def calculate_elo(your_elo: int, opponent_elo: int, is_your_win: bool) -> list[i
 	  is_your_win (bool): A boolean that's True if you won the match and False if you lost.
 
 	Returns:
-	  list[int]: A two-element list where the first element is your updated Elo rating,
-				 and the second element is your opponent's updated Elo rating.
+	  tuple[int, int]: A two-element tuple where the first element is your updated Elo rating,
+					   and the second element is your opponent's updated Elo rating.
 
 	References:
 	  - https://en.wikipedia.org/wiki/Elo_rating_system
@@ -49,101 +57,176 @@ def calculate_elo(your_elo: int, opponent_elo: int, is_your_win: bool) -> list[i
 	Notes:
 	  The constants used in this function (k-factor of 32 and a divisor of 400) are commonly used in chess,
 	  but they can be adjusted depending on the specifics of your games and player base.
+	  The function is compiled with numba when it is installed.
 	"""
     k = 32
     s = 400
     your_expected_score = 1 / (1 + 10 ** ((opponent_elo - your_elo) / s))
 
     if is_your_win:
-        your_elo += k * (1 - your_expected_score)
-        opponent_elo -= k * (1 - your_expected_score)
+        elo_change = k * (1 - your_expected_score)
     else:
-        your_elo -= k * your_expected_score
-        opponent_elo += k * your_expected_score
+        elo_change = -k * your_expected_score
 
-    return [int(your_elo), int(opponent_elo)]
+    return int(your_elo + elo_change), int(opponent_elo - elo_change)
+
+
+def play_ranked_match(your_bot: BaseBot, 
+                      opponent_bot: BaseBot,
+                      match_dir: Path, 
+                      seed: int,
+                      is_your_turn_first: bool) -> bool:
+    """Play one ranked match between two bots, with its own rng system. 
+        Matches are independent of each other, so they can run in separate processes.
+        The bots are reset for the match, so the same instances can play several of them.
+
+    Arguments:
+        your_bot -- the bot to benchmark
+        opponent_bot -- the opponent bot
+        match_dir -- the directory containing the sample starting assignments of this match
+        seed -- the pseudo rng seed of this match
+        is_your_turn_first -- whether your bot plays first in the first round
+
+    Returns:
+        whether your bot won the match or not: True if it did, False otherwise
+    """
+    rng_engine = RngEngine(seed=seed)
+    your_round_wins, opponent_round_wins = 0, 0
+    your_assignments = match_dir / "your_assignments"
+    opponent_assignments = match_dir / "opponent_assignments"
+    
+    # the assignments are handed to play_round in memory instead of through the files
+    your_bot.reset(your_assignments, persist_to_disk=False)
+    opponent_bot.reset(opponent_assignments, persist_to_disk=False)
+    
+    for round in range(1, N_ROUNDS + 1):        
+        your_bot.write_assignment(*your_bot.make_assignment())
+        opponent_bot.write_assignment(*opponent_bot.make_assignment())
+        
+        output = play_round(
+            your_assignment=your_assignments / f"{round}.json",
+            opponent_assignment=opponent_assignments / f"{round}.json",
+            is_your_turn_first=is_your_turn_first,
+            rng_engine=rng_engine,
+            record=False,
+            your_assignment_data=your_bot.last_assignment,
+            opponent_assignment_data=opponent_bot.last_assignment
+        )
+        if len(output) == 3:
+            is_round_your_win, _, (your_team, opponent_team) = output
+            your_bot.process_previous_round_stats(
+                is_round_your_win, your_team, opponent_team)
+            opponent_bot.process_previous_round_stats(
+                not is_round_your_win, opponent_team, your_team)
+        else:
+            is_round_your_win, _ = output
+            warnings.warn(("List of teams from play_round not found. "
+                           "Proceeding without the bots processing "
+                           "round data. Some bots will not perform correctly."))
+        
+        if is_round_your_win:
+            your_round_wins += 1
+        else:
+            opponent_round_wins += 1
+
+        is_your_turn_first = not is_your_turn_first
+        is_match_over = your_round_wins == N_WINS or opponent_round_wins == N_WINS
+        if is_match_over:
+            break
+    
+    return your_round_wins > opponent_round_wins
+
+
+def play_ranked_matches(your_bot_factory: Callable[[], BaseBot], 
+                        opponent_bot_factory: Callable[[], BaseBot],
+                        match_dirs: list[Path], 
+                        seeds: list[int],
+                        first_turns: list[bool]) -> list[bool]:
+    """Play a batch of ranked matches in order, with the same two bots reset between matches.
+
+    Arguments:
+        your_bot_factory -- creates the bot to benchmark
+        opponent_bot_factory -- creates the opponent bot
+        match_dirs -- the directories containing the sample starting assignments of each match
+        seeds -- the pseudo rng seed of each match
+        first_turns -- whether your bot plays first in the first round of each match
+
+    Returns:
+        whether your bot won each match or not
+    """
+    your_bot = your_bot_factory()
+    opponent_bot = opponent_bot_factory()
+    return [play_ranked_match(your_bot, opponent_bot, match_dir, seed, is_your_turn_first)
+            for match_dir, seed, is_your_turn_first in zip(match_dirs, seeds, first_turns)]
 
 
 def play_ranked(your_algo: str, opponent_algos: list[str], n_matches: int, 
-                sample_match_dir: Path) -> None:
+                sample_match_dir: Path, n_workers: int | None = None) -> None:
     """Play the ranked mode of the game, battling other bots with elo at the stake.
+    
+    The matches against each opponent are played in parallel processes, each
+    with its own seed, while the elo is updated in match order once they are over.
 
     Arguments:
         your_algo -- the algorithm to benchmark
         opponent_algos -- the opponent algorithm(s) to benchmark against
         n_matches -- th number of matches to use
         sample_match_dir -- the directory containing the sample starting assignments
-    """
-    for opponent_algo in opponent_algos:
         
-        if opponent_algo == your_algo:  # add prefix to prevent potential overlap
-            opponent_algo = f"opponent__{opponent_algo}"
-            BOT_MAPPING[opponent_algo] = BOT_MAPPING[your_algo]
-            current_elo[opponent_algo] = current_elo[your_algo]
+    Keyword Arguments:
+        n_workers -- the number of processes playing the matches, 
+            every CPU if None (default: {None})
+    """
+    global current_elo  # grown when a bot plays against itself
+    match_dirs = [sample_match_dir / f"match_{match_idx}" for match_idx in range(1, n_matches + 1)]
+    seeds = range(1, n_matches + 1)
+    # who plays first in each match is rolled for all of them at once
+    first_turns = RngEngine().rng_many(np.full(n_matches, 50)).tolist()
+    preload_team_data(sample_match_dir)
+    # one batch of matches per worker, each creating its bots once
+    batch_size = -(-n_matches // (n_workers or os.cpu_count() or 1))
+    batches = [slice(start, start + batch_size) for start in range(0, n_matches, batch_size)]
+    
+    with ProcessPoolExecutor(max_workers=n_workers) as executor:
+        for opponent_algo in opponent_algos:
             
-        rng_engine = RngEngine()
-        n_match_wins = 0
-        starting_elo = current_elo[your_algo]
-        for match_idx in range(1, n_matches + 1):
-            is_your_turn_first = rng_engine.rng(probability=50)
-            your_round_wins, opponent_round_wins = 0, 0
-            your_assignments = sample_match_dir / f"match_{match_idx}" / "your_assignments"
-            opponent_assignments = sample_match_dir / f"match_{match_idx}" / "opponent_assignments"
+            if opponent_algo == your_algo:  # add prefix to prevent potential overlap
+                opponent_algo = f"opponent__{opponent_algo}"
+                BOT_MAPPING[opponent_algo] = BOT_MAPPING[your_algo]
+                if opponent_algo not in BOT_IDS:
+                    BOT_IDS[opponent_algo] = len(current_elo)
+                    current_elo = np.append(current_elo, current_elo[BOT_IDS[your_algo]])
+                current_elo[BOT_IDS[opponent_algo]] = current_elo[BOT_IDS[your_algo]]
+                
+            n_match_wins = 0
+            your_id, opponent_id = BOT_IDS[your_algo], BOT_IDS[opponent_algo]
+            # the elo is tracked in locals during the matches, then stored once they are over
+            starting_elo = your_elo = int(current_elo[your_id])
+            opponent_elo = int(current_elo[opponent_id])
+            your_bot_factory = BOT_MAPPING[your_algo]
+            opponent_bot_factory = BOT_MAPPING[opponent_algo]
+            batch_outcomes = executor.map(play_ranked_matches, 
+                                          repeat(your_bot_factory),
+                                          repeat(opponent_bot_factory),
+                                          [match_dirs[batch] for batch in batches], 
+                                          [seeds[batch] for batch in batches], 
+                                          [first_turns[batch] for batch in batches])
+            for is_match_your_win in chain.from_iterable(batch_outcomes):
+                n_match_wins += 1 if is_match_your_win else 0
+                your_elo, opponent_elo = calculate_elo(
+                    your_elo=your_elo,
+                    opponent_elo=opponent_elo,
+                    is_your_win=is_match_your_win)
+            current_elo[your_id] = your_elo
+            current_elo[opponent_id] = opponent_elo
             
-            your_bot = BOT_MAPPING[your_algo]()
-            opponent_bot = BOT_MAPPING[opponent_algo]()
-            your_bot.initialize(your_assignments)
-            opponent_bot.initialize(opponent_assignments)
+            # undo the prefix we may have added
+            opponent_algo = opponent_algo.removeprefix('opponent__') 
             
-            for round in range(1, N_ROUNDS + 1):        
-                your_assignment = your_bot.make_assignment()
-                your_bot.write_assignment(your_assignment)
-                opponent_assignment = opponent_bot.make_assignment()
-                opponent_bot.write_assignment(opponent_assignment)
-                
-                output = play_round(
-                    your_assignment=your_assignments / f"{round}.json",
-                    opponent_assignment=opponent_assignments / f"{round}.json",
-                    is_your_turn_first=is_your_turn_first,
-                    rng_engine=rng_engine
-                )
-                if len(output) == 3:
-                    is_round_your_win, _, (your_team, opponent_team) = output
-                    your_bot.process_previous_round_stats(
-                        is_round_your_win, your_team, opponent_team)
-                    opponent_bot.process_previous_round_stats(
-                        not is_round_your_win, opponent_team, your_team)
-                else:
-                    is_round_your_win, _ = output
-                    warnings.warn(("List of teams from play_round not found. "
-                                   "Proceeding without the bots processing "
-                                   "round data. Some bots will not perform correctly."))
-                
-                if is_round_your_win:
-                    your_round_wins += 1
-                else:
-                    opponent_round_wins += 1
-
-                is_your_turn_first = not is_your_turn_first
-                is_match_over = your_round_wins == N_WINS or opponent_round_wins == N_WINS
-                
-                if is_match_over:
-                    n_match_wins += 1 if is_round_your_win else 0
-                    your_elo, opponent_elo = calculate_elo(
-                        your_elo=current_elo[your_algo],
-                        opponent_elo=current_elo[opponent_algo],
-                        is_your_win=is_round_your_win)
-                    current_elo[your_algo] = your_elo
-                    current_elo[opponent_algo] = opponent_elo
-                    break
-        
-        # undo the prefix we may have added
-        opponent_algo = opponent_algo.removeprefix('opponent__') 
-        
-        print((f"{your_algo} won {n_match_wins/n_matches * 100:.1f}% ({n_match_wins}/{n_matches})"
-               f" of the matches against {opponent_algo}, ending with {current_elo[your_algo]}"
-               f"({'+' if current_elo[your_algo] >= starting_elo else '-'}"
-               f"{abs(current_elo[your_algo] - starting_elo)}) elo."))
+            print((f"{your_algo} won {n_match_wins/n_matches * 100:.1f}% ({n_match_wins}/{n_matches})"
+                   f" of the matches against {opponent_algo}, ending with {your_elo}"
+                   f"({'+' if your_elo >= starting_elo else '-'}"
+                   f"{abs(your_elo - starting_elo)}) elo."))
 
 
 if __name__ == "__main__":
@@ -161,6 +244,9 @@ if __name__ == "__main__":
                         help="The number of matches to play against each bot")
     parser.add_argument("--sample_match_dir", type=str, default="./samples",
                         help="The directory of the same match team data")
+    parser.add_argument("--n_workers", type=int, default=None,
+                        help=("The number of processes playing the matches. "
+                              "If left empty, will use every CPU"))
     args = parser.parse_args()
     opponent_bots = args.opponent_bots
     if opponent_bots is None:
@@ -168,4 +254,4 @@ if __name__ == "__main__":
     if not isinstance(opponent_bots, list):
             opponent_bots = [opponent_bots]
     sample_match_dir = Path(args.sample_match_dir)
-    play_ranked(args.your_bot, opponent_bots, args.n_matches, sample_match_dir)
+    play_ranked(args.your_bot, opponent_bots, args.n_matches, sample_match_dir, args.n_workers)
@@ -1,11 +1,19 @@
 from pathlib import Path
+import numpy as np
 from utils import BaseCharacter, Stats, Attack, Damage, RngEngine
-from game import read_data
+from game import read_data, build_team, make_team_template, read_team_template, team_effective_stats
+from jit_utils import njit, prange, IS_JIT_AVAILABLE
 
 N_ROUNDS = 5
 N_WINS = 3
 DASHES = "-" * 20
 
+# columns of the per-character arrays used by the batched simulator
+(CURRENT_HP, TOTAL_HP, ARMOR, MAGIC_RESISTANCE, 
+ PHYSICAL_POWER, MAGIC_POWER, SPECIAL_TRIGGER_CHANCE) = range(len(Stats._fields))
+BASIC_PHYSICAL, BASIC_MAGIC, SPECIAL_PHYSICAL, SPECIAL_MAGIC, SPECIAL_HEAL = range(5)
+SPECIAL_COLUMNS = {"physical": SPECIAL_PHYSICAL, "magic": SPECIAL_MAGIC, "heal": SPECIAL_HEAL}
+
 
 def pretty_format_teams(your_team: list[BaseCharacter], 
                         opponent_team: list[BaseCharacter]) -> str:
@@ -18,59 +26,53 @@ def pretty_format_teams(your_team: list[BaseCharacter],
     Returns:
         the pretty formatted string of the teams
     """
-    your_team = [char.name for char in reversed(your_team)]
-    opponent_team = [char.name for char in opponent_team]
-    return f"\n\t{your_team} -----VS----- {opponent_team}"
+    your_names = ", ".join(f"'{char.name}'" for char in reversed(your_team))
+    opponent_names = ", ".join(f"'{char.name}'" for char in opponent_team)
+    return f"\n\t[{your_names}] -----VS----- [{opponent_names}]"
     
 
-def calculate_damage_taken(damage: Damage, character_stats: Stats) -> Stats:
-    """
-    Calculates the actual damage dealt to a character based on their stats
-    and the incoming damage.
-
-    Damage is reduced by the character's armor or magic resistance.
+def pretty_format_hp(character: BaseCharacter) -> str:
+    """Format the hp of a character for printing
 
-    Args:
-        damage (Damage): The incoming damage, which can be physical and/or magical.
-        character_stats (Stats): The stats of the character getting hit.
+    Arguments:
+        character -- the character to format the hp of
 
     Returns:
-        Stats: A Stats object where the current_hp attribute is set to
-        the negative of the actual damage dealt.
+        the pretty formatted string of the current and total hp
     """
-    hp_lost = 0
-    hp_lost += (damage.physical - damage.physical * character_stats.armor / 100)
-    hp_lost += (damage.magic - damage.magic * character_stats.magic_resistance / 100)
-    return Stats(current_hp=-hp_lost)
+    stats = character.effective_stats
+    return f"[{stats.current_hp:.1f}/{stats.total_hp:.1f}]"
 
 
-def calculate_miss_chance(damage: Damage, character_stats: Stats) -> float:
+def resolve_attack(damage: Damage, character_stats: Stats) -> tuple[float, float]:
     """
-    Calculates the chance that an attack will miss based on the character's
-    stats and the type of incoming damage.
+    Calculates both the chance that an attack will miss and the actual damage
+    it deals if it lands, reading the damage and the defender's stats once.
 
     For physical damage, the miss chance is proportional to the character's armor / 10.
     Similarly, for magical damage, it is proportional to the magic resistance / 10.
-    If there is no incoming damage, the miss chance is 0.
+    Damage is reduced by the character's armor or magic resistance.
 
     Args:
-        damage (Damage): The incoming damage, which can be physical or magical
-        character_stats (Stats): The stats of the character aiming to dodge the attack
+        damage (Damage): The incoming damage, which can be physical and/or magical.
+        character_stats (Stats): The stats of the character getting hit.
 
     Returns:
-        float: The calculated miss chance
+        tuple[float, float]: The calculated miss chance and the hp the
+        character loses if the attack lands.
     """
-    if damage.magic > damage.physical:
-        miss_chance = character_stats.magic_resistance / 10
-    else:
-        miss_chance = character_stats.armor / 10
-    return miss_chance
+    physical, magic = damage
+    armor, magic_resistance = character_stats.armor, character_stats.magic_resistance
+    miss_chance = (magic_resistance if magic > physical else armor) / 10
+    hp_lost = (physical - physical * armor / 100) + (magic - magic * magic_resistance / 100)
+    return miss_chance, hp_lost
 
 
 def play_turn(your_character: BaseCharacter, 
               opponent_character: BaseCharacter, 
               is_your_turn: bool,
-              rng_engine: RngEngine) -> str:
+              rng_engine: RngEngine,
+              record: bool = True) -> str:
     """Take a turn in the game, updating the character's stats and returning 
         a description of what happened in the turn
         
@@ -82,58 +84,69 @@ def play_turn(your_character: BaseCharacter,
         opponent_character -- the opponent's character
         is_your_move -- whether it is your move or not
         rng_engine -- the rng system handling the randomness in the game
+        record -- whether to build the description, skipped when only 
+            the outcome matters (default: {True})
 
     Returns:
-        the description of what happened in the move
+        the description of what happened in the move, empty if not recorded
     """
-    if any([char.effective_stats.current_hp <= 0 
-            for char in [your_character, opponent_character]]):
+    if (your_character.effective_stats.current_hp <= 0 
+            or opponent_character.effective_stats.current_hp <= 0):
         raise ValueError("One of the characters is already dead")
                 
     attacking_char = your_character if is_your_turn else opponent_character
     attacking_player = "Your" if is_your_turn else "Opponent's"
     defending_char = opponent_character if is_your_turn else your_character
     defending_player = "Opponent's" if is_your_turn else "Your"
+    attacking_stats = attacking_char.effective_stats
+    defending_stats = defending_char.effective_stats
     
-    special_chance = attacking_char.effective_stats.special_trigger_chance
+    special_chance = attacking_stats.special_trigger_chance
     is_attack_special = rng_engine.rng(probability=special_chance)
     attack = (attacking_char.basic_attack if not is_attack_special 
               else attacking_char.special_attack)
+    extra_description = ""
         
     if attack.stat_updates_to_self is not None:
         attacking_char.effective_stats = \
-            attacking_char.effective_stats.add_stat_changes(attack.stat_updates_to_self)
-        extra_description = ""
+            attacking_stats.add_stat_changes(attack.stat_updates_to_self)
     
     else:
-        miss_chance = calculate_miss_chance(damage=attack.damage, 
-                                            character_stats=defending_char.effective_stats)
+        miss_chance, hp_lost = resolve_attack(damage=attack.damage, 
+                                              character_stats=defending_stats)
         is_damage_missed = rng_engine.rng(probability=miss_chance)
         if is_damage_missed:
-            extra_description = f"It missed {defending_player} {defending_char.name}."
+            if record:
+                extra_description = f"It missed {defending_player} {defending_char.name}."
         else:
-            hp_update = calculate_damage_taken(damage=attack.damage, 
-                                            character_stats=defending_char.effective_stats)
-            defending_char.effective_stats = \
-                defending_char.effective_stats.add_stat_changes(hp_update)
-            extra_description = f"{defending_player} {defending_char.name} lost {-hp_update.current_hp:.3f} HP. "
+            defending_stats = defending_stats.add_hp_change(-hp_lost)
+            defending_char.effective_stats = defending_stats
+            if record:
+                extra_description = f"{defending_player} {defending_char.name} lost {hp_lost:.3f} HP. "
 
             total_damage = attack.damage.physical + attack.damage.magic
             attacking_char.damage_stats.damage_dealt += total_damage
             defending_char.damage_stats.damage_taken += total_damage
-            defending_char.damage_stats.damage_mitigated += (total_damage - abs(hp_update.current_hp))
+            defending_char.damage_stats.damage_mitigated += (total_damage - abs(hp_lost))
 
-            if defending_char.effective_stats.current_hp == 0:
-                extra_description += f"It fainted."
+            if defending_stats.current_hp == 0:
+                if record:
+                    extra_description += f"It fainted."
                 attacking_char.damage_stats.kills += 1
-            
+    
+    if not record:
+        return ""
     return f"{attacking_player} {attack.description} {extra_description}"
 
 
 def play_round(your_assignment: Path, 
                opponent_assignment: Path,
                is_your_turn_first: bool, 
-               rng_engine: RngEngine) -> tuple[bool, list[str], tuple[list[BaseCharacter], list[BaseCharacter]]]:
+               rng_engine: RngEngine,
+               record: bool = True,
+               your_assignment_data: list[dict] | None = None,
+               opponent_assignment_data: list[dict] | None = None
+               ) -> tuple[bool, list[str], tuple[list[BaseCharacter], list[BaseCharacter]]]:
     """Play the **round** out under the game engine.
 
     Arguments:
@@ -141,33 +154,42 @@ def play_round(your_assignment: Path,
         opponent_assignment -- the opponent's assignment for this round
         is_your_turn_first -- whether the first player to take turn is you
         rng_engine -- the rng system handling the randomness in the game
+        record -- whether to build the turn-by-turn breakdown, skipped when only 
+            the outcome matters (default: {True})
+        your_assignment_data -- your team assignment already in memory, 
+            played instead of reading your_assignment (default: {None})
+        opponent_assignment_data -- the opponent's assignment already in memory, 
+            played instead of reading opponent_assignment (default: {None})
 
     Returns:
         a tuple of the outcome and a list of the **round** breakdown:
             - whether you won or not: True if you did, False otherwise
-            - the turn-by-turn breakdown of what happened throughout
+            - the turn-by-turn breakdown of what happened throughout, empty if not recorded
+            - the teams at the end of the round
     """
-    your_team = read_data(your_assignment)
-    opponent_team = read_data(opponent_assignment)
+    your_team = (read_data(your_assignment) if your_assignment_data is None
+                 else build_team(make_team_template(your_assignment_data)))
+    opponent_team = (read_data(opponent_assignment) if opponent_assignment_data is None
+                     else build_team(make_team_template(opponent_assignment_data)))
     your_char_idx = opponent_char_idx = 0
     
     is_your_turn = is_your_turn_first
     
-    pretty_format_hp = lambda char: f"[{char.effective_stats.current_hp:.1f}/{char.effective_stats.total_hp:.1f}]"
-    
-    play_by_play_description = [pretty_format_teams(your_team, opponent_team)]
+    play_by_play_description = [pretty_format_teams(your_team, opponent_team)] if record else []
     
     while your_char_idx < len(your_team) and opponent_char_idx < len(opponent_team):
         your_character = your_team[your_char_idx]
         opponent_character = opponent_team[opponent_char_idx]
-        play_by_play_description.append(
-            (f"\t{your_character.name} {pretty_format_hp(your_character)}"
-             f" VS "
-             f"{opponent_character.name} {pretty_format_hp(opponent_character)}"
-             ))
+        if record:
+            play_by_play_description.append(
+                (f"\t{your_character.name} {pretty_format_hp(your_character)}"
+                 f" VS "
+                 f"{opponent_character.name} {pretty_format_hp(opponent_character)}"
+                 ))
         
-        outcome = play_turn(your_character, opponent_character, is_your_turn, rng_engine)
-        play_by_play_description.append(f"\t\t{outcome}")
+        outcome = play_turn(your_character, opponent_character, is_your_turn, rng_engine, record)
+        if record:
+            play_by_play_description.append(f"\t\t{outcome}")
         is_char_down = False
         if your_character.effective_stats.current_hp <= 0:
             your_char_idx += 1
@@ -175,8 +197,8 @@ def play_round(your_assignment: Path,
         if opponent_character.effective_stats.current_hp <= 0:
             opponent_char_idx += 1
             is_char_down = True
-        if is_char_down and (your_char_idx < len(your_team) 
-                             and opponent_char_idx < len(opponent_team)):
+        if record and is_char_down and (your_char_idx < len(your_team) 
+                                        and opponent_char_idx < len(opponent_team)):
             play_by_play_description.append(
                 pretty_format_teams(your_team[your_char_idx:], opponent_team[opponent_char_idx:]))  
             
@@ -187,33 +209,39 @@ def play_round(your_assignment: Path,
 
 def play_match(your_assignments: Path, 
                opponent_assignments: Path,
-               rng_engine: RngEngine) -> tuple[bool, list[str]]:
+               rng_engine: RngEngine,
+               record: bool = True) -> tuple[bool, list[str]]:
     """Play the match out under the game engine. 
 
     Arguments:
         your_assignments -- your assignments for all rounds in the match
         opponent_assignments -- the opponent's assignments for all rounds in the match
         rng_engine -- the rng system handling the randomness in the game
+        record -- whether to build the turn-by-turn breakdown, skipped when only 
+            the outcome matters (default: {True})
 
     Returns:
         a tuple of the outcome and a list of the match breakdown:
             - whether you won or not: True if you did, False otherwise
-            - the turn-by-turn breakdown of what happened throughout
+            - the turn-by-turn breakdown of what happened throughout, empty if not recorded
     """
     
     is_your_turn_first = rng_engine.rng(probability=50)
     your_wins, opponent_wins = 0, 0
     play_by_play_description = []
     for round in range(1, N_ROUNDS + 1):        
-        play_by_play_description.append(f"\n{DASHES} Round {round}. {DASHES}")
-        is_round_your_win, round_description = play_round(
+        if record:
+            play_by_play_description.append(f"\n{DASHES} Round {round}. {DASHES}")
+        is_round_your_win, round_description, _ = play_round(
             your_assignment=your_assignments / f"{round}.json",
             opponent_assignment=opponent_assignments / f"{round}.json",
             is_your_turn_first=is_your_turn_first,
-            rng_engine=rng_engine
+            rng_engine=rng_engine,
+            record=record
         )
-        round_description = [f"\t{turn_description}" for turn_description in round_description]
-        play_by_play_description.extend(round_description)
+        if record:
+            round_description = [f"\t{turn_description}" for turn_description in round_description]
+            play_by_play_description.extend(round_description)
         
         if is_round_your_win:
             your_wins += 1
@@ -221,17 +249,268 @@ def play_match(your_assignments: Path,
         else:
             opponent_wins += 1
             round_outcome = "LOSS"
-        play_by_play_description.append(
-            f"\nOutcome: {round_outcome}. Series Score: {your_wins}-{opponent_wins}.")
+        if record:
+            play_by_play_description.append(
+                f"\nOutcome: {round_outcome}. Series Score: {your_wins}-{opponent_wins}.")
         is_your_turn_first = not is_your_turn_first
         
         is_match_over = your_wins == N_WINS or opponent_wins == N_WINS
         if is_match_over:
-            play_by_play_description.append(
-                f"\n{DASHES} {round_outcome} {your_wins}-{opponent_wins}. {DASHES}")
+            if record:
+                play_by_play_description.append(
+                    f"\n{DASHES} {round_outcome} {your_wins}-{opponent_wins}. {DASHES}")
             break
         
     return your_wins > opponent_wins, play_by_play_description
+
+
+def play_seeded_match(your_assignments: Path,
+                      opponent_assignments: Path,
+                      seed: int) -> bool:
+    """Play one match out with its own rng system, without any play-by-play.
+        Matches played this way are independent, so they can run in separate processes.
+
+    Arguments:
+        your_assignments -- your assignments for all rounds in the match
+        opponent_assignments -- the opponent's assignments for all rounds in the match
+        seed -- the pseudo rng seed of this match
+
+    Returns:
+        whether you won or not: True if you did, False otherwise
+    """
+    is_your_win, _ = play_match(your_assignments=your_assignments,
+                                opponent_assignments=opponent_assignments,
+                                rng_engine=RngEngine(seed=seed),
+                                record=False)
+    return is_your_win
+
+
+def load_team_arrays(team_assignment: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Read a team assignment into the per-character arrays of the batched simulator.
+
+    Arguments:
+        team_assignment -- the team assignment file to read
+
+    Returns:
+        a tuple of arrays, indexed by the position of the character in the team:
+            - the effective stats, one column per Stats field
+            - the attacks: basic physical and magic damage, special physical and 
+                magic damage, and the hp healed by the special attack
+            - whether the special attack heals instead of dealing damage
+    """
+    team_template = read_team_template(team_assignment)
+    # the effective stats of the whole team at once, without creating the characters
+    stats = team_effective_stats(team_template)
+    character_classes = [character_class for character_class, _, _ in team_template]
+    special_coeffs = np.array([char.SPECIAL_COEFFS[:3] for char in character_classes], dtype=np.float64)
+    special_columns = np.array([SPECIAL_COLUMNS[char.SPECIAL_COEFFS[3]] for char in character_classes], 
+                               dtype=np.int64)
+    
+    attacks = np.zeros((len(team_template), 5))
+    attacks[:, BASIC_PHYSICAL] = stats[:, PHYSICAL_POWER]
+    # the special attacks of the whole team as one affine transform of the stats
+    attacks[np.arange(len(team_template)), special_columns] = (
+        special_coeffs[:, 0] + special_coeffs[:, 1] * stats[:, PHYSICAL_POWER] 
+        + special_coeffs[:, 2] * stats[:, MAGIC_POWER])
+    return stats, attacks, special_columns == SPECIAL_HEAL
+
+
+def play_turn_batch(matches: np.ndarray,
+                    attacking_hp: np.ndarray,
+                    defending_hp: np.ndarray,
+                    attacking_idx: np.ndarray,
+                    defending_idx: np.ndarray,
+                    attacking_team: tuple[np.ndarray, np.ndarray, np.ndarray],
+                    defending_team: tuple[np.ndarray, np.ndarray, np.ndarray],
+                    rolls: np.ndarray) -> None:
+    """Take a turn in a batch of matches at once, following the rules of play_turn.
+        The hp of the characters and the index of the defending character 
+        are updated in place.
+
+    Arguments:
+        matches -- the indices of the matches where this team is attacking
+        attacking_hp -- the current hp of the attacking team, of shape (n_matches, team size)
+        defending_hp -- the current hp of the defending team, of shape (n_matches, team size)
+        attacking_idx -- the index of the attacking team's current character in each match
+        defending_idx -- the index of the defending team's current character in each match
+        attacking_team -- the arrays of the attacking team, as made by load_team_arrays
+        defending_team -- the arrays of the defending team, as made by load_team_arrays
+        rolls -- the special attack and miss dice of each of these matches, of shape (2, len(matches))
+    """
+    attacking_stats, attacking_attacks, is_special_heal = attacking_team
+    defending_stats = defending_team[0]
+    attacking_chars = attacking_idx[matches]
+    defending_chars = defending_idx[matches]
+    special_rolls, miss_rolls = rolls
+    
+    is_attack_special = special_rolls < (
+        attacking_stats[attacking_chars, SPECIAL_TRIGGER_CHANCE] / 100)
+    attacks = attacking_attacks[attacking_chars]
+    physical = np.where(is_attack_special, attacks[:, SPECIAL_PHYSICAL], attacks[:, BASIC_PHYSICAL])
+    magic = np.where(is_attack_special, attacks[:, SPECIAL_MAGIC], attacks[:, BASIC_MAGIC])
+    
+    is_heal = is_attack_special & is_special_heal[attacking_chars]
+    healed_matches, healed_chars = matches[is_heal], attacking_chars[is_heal]
+    attacking_hp[healed_matches, healed_chars] = np.minimum(
+        attacking_stats[healed_chars, TOTAL_HP],
+        attacking_hp[healed_matches, healed_chars] + attacks[is_heal, SPECIAL_HEAL])
+    
+    armor = defending_stats[defending_chars, ARMOR]
+    magic_resistance = defending_stats[defending_chars, MAGIC_RESISTANCE]
+    miss_chance = np.where(magic > physical, magic_resistance, armor) / 10
+    is_hit = ~is_heal & ~(miss_rolls < (miss_chance / 100))
+    hp_lost = (physical - physical * armor / 100) + (magic - magic * magic_resistance / 100)
+    hit_matches, hit_chars = matches[is_hit], defending_chars[is_hit]
+    defending_hp[hit_matches, hit_chars] = np.minimum(
+        defending_stats[hit_chars, TOTAL_HP],
+        np.maximum(0, defending_hp[hit_matches, hit_chars] - hp_lost[is_hit]))
+    defending_idx[hit_matches] += defending_hp[hit_matches, hit_chars] <= 0
+
+
+@njit(cache=True)
+def _play_turn_jit(match, attacking_hp, defending_hp, attacking_idx, defending_idx,
+                   attacking_stats, attacking_attacks, is_special_heal, defending_stats,
+                   special_roll, miss_roll):
+    """The single match version of play_turn_batch, compiled by numba."""
+    attacking_char = attacking_idx[match]
+    defending_char = defending_idx[match]
+    is_attack_special = special_roll < (
+        attacking_stats[attacking_char, SPECIAL_TRIGGER_CHANCE] / 100)
+    
+    if is_attack_special and is_special_heal[attacking_char]:
+        attacking_hp[match, attacking_char] = min(
+            attacking_stats[attacking_char, TOTAL_HP],
+            attacking_hp[match, attacking_char] + attacking_attacks[attacking_char, SPECIAL_HEAL])
+        return
+    
+    if is_attack_special:
+        physical = attacking_attacks[attacking_char, SPECIAL_PHYSICAL]
+        magic = attacking_attacks[attacking_char, SPECIAL_MAGIC]
+    else:
+        physical = attacking_attacks[attacking_char, BASIC_PHYSICAL]
+        magic = attacking_attacks[attacking_char, BASIC_MAGIC]
+    armor = defending_stats[defending_char, ARMOR]
+    magic_resistance = defending_stats[defending_char, MAGIC_RESISTANCE]
+    miss_chance = (magic_resistance if magic > physical else armor) / 10
+    if miss_roll < (miss_chance / 100):
+        return
+    
+    hp_lost = (physical - physical * armor / 100) + (magic - magic * magic_resistance / 100)
+    hp = min(defending_stats[defending_char, TOTAL_HP],
+             max(0.0, defending_hp[match, defending_char] - hp_lost))
+    defending_hp[match, defending_char] = hp
+    if hp <= 0:
+        defending_idx[match] += 1
+
+
+@njit(parallel=True, cache=True)
+def play_turns_jit(matches, is_your_turn_first, is_second_players_turn, 
+                   your_hp, opponent_hp, your_idx, opponent_idx,
+                   your_stats, your_attacks, your_special_heal,
+                   opponent_stats, opponent_attacks, opponent_special_heal, rolls):
+    """Take a turn in each of the matches, the numba compiled counterpart of 
+        running play_turn_batch for both teams. 
+        
+        Matches are independent, so they are spread over threads with prange.
+    """
+    for i in prange(len(matches)):
+        match = matches[i]
+        if is_your_turn_first[match] != is_second_players_turn:
+            _play_turn_jit(match, your_hp, opponent_hp, your_idx, opponent_idx,
+                           your_stats, your_attacks, your_special_heal, opponent_stats,
+                           rolls[0, i], rolls[1, i])
+        else:
+            _play_turn_jit(match, opponent_hp, your_hp, opponent_idx, your_idx,
+                           opponent_stats, opponent_attacks, opponent_special_heal, your_stats,
+                           rolls[0, i], rolls[1, i])
+
+
+def play_round_batch(your_assignment: Path,
+                     opponent_assignment: Path,
+                     is_your_turn_first: np.ndarray,
+                     rng_engine: RngEngine) -> np.ndarray:
+    """Play the same **round** out in a batch of matches at once, without 
+        any play-by-play. Every match keeps its state in numpy arrays, 
+        so a single vectorized turn advances all of them.
+        
+        The turns run under numba when it is installed, and under numpy otherwise,
+        with the same outcomes for the same rng system.
+
+    Arguments:
+        your_assignment -- your team assignment for this round
+        opponent_assignment -- the opponent's assignment for this round
+        is_your_turn_first -- whether the first player to take turn is you, for each match
+        rng_engine -- the rng system handling the randomness in the game
+
+    Returns:
+        a boolean array, True for every match where you won the round
+    """
+    teams = [load_team_arrays(your_assignment), load_team_arrays(opponent_assignment)]
+    team_sizes = [len(stats) for stats, _, _ in teams]
+    n_matches = len(is_your_turn_first)
+    hp = [np.tile(stats[:, CURRENT_HP], (n_matches, 1)) for stats, _, _ in teams]
+    char_idx = [np.zeros(n_matches, dtype=np.int64) for _ in teams]
+    
+    is_your_turn_first = np.asarray(is_your_turn_first, dtype=bool)
+    # every live match takes its turn together, so a single flag tells whose turn it is 
+    # in all of them, and finished matches are never touched again
+    is_second_players_turn = False
+    live_matches = np.arange(n_matches)
+    while len(live_matches):
+        rolls = rng_engine.uniforms((2, len(live_matches)))
+        if IS_JIT_AVAILABLE:
+            play_turns_jit(live_matches, is_your_turn_first, is_second_players_turn,
+                           *hp, *char_idx, *teams[0], *teams[1], rolls)
+        else:
+            is_live_your_turn = is_your_turn_first[live_matches] != is_second_players_turn
+            # the attacking team is 0 (you) where it is your turn, 1 (opponent) otherwise
+            for attacking, is_attacking in enumerate([is_live_your_turn, ~is_live_your_turn]):
+                defending = 1 - attacking
+                play_turn_batch(live_matches[is_attacking], hp[attacking], hp[defending], 
+                                char_idx[attacking], char_idx[defending],
+                                teams[attacking], teams[defending], rolls[:, is_attacking])
+        is_second_players_turn = not is_second_players_turn
+        live_matches = live_matches[(char_idx[0][live_matches] < team_sizes[0]) 
+                                    & (char_idx[1][live_matches] < team_sizes[1])]
+    
+    return char_idx[0] < char_idx[1]
+
+
+def play_match_batch(your_assignments: Path,
+                     opponent_assignments: Path,
+                     n_matches: int,
+                     rng_engine: RngEngine) -> np.ndarray:
+    """Play the same match out n_matches times under the game engine, 
+        simulating all of them at once. Useful to estimate the win rate
+        of a set of assignments without building any play-by-play.
+
+    Arguments:
+        your_assignments -- your assignments for all rounds in the match
+        opponent_assignments -- the opponent's assignments for all rounds in the match
+        n_matches -- the number of matches to simulate
+        rng_engine -- the rng system handling the randomness in the game
+
+    Returns:
+        a boolean array, True for every simulated match you won
+    """
+    is_your_turn_first = rng_engine.rng_many(np.full(n_matches, 50))
+    your_wins = np.zeros(n_matches, dtype=np.int64)
+    opponent_wins = np.zeros(n_matches, dtype=np.int64)
+    for round in range(1, N_ROUNDS + 1):
+        matches = np.flatnonzero((your_wins < N_WINS) & (opponent_wins < N_WINS))
+        if len(matches) == 0:
+            break
+        is_round_your_win = play_round_batch(
+            your_assignment=your_assignments / f"{round}.json",
+            opponent_assignment=opponent_assignments / f"{round}.json",
+            is_your_turn_first=is_your_turn_first[matches],
+            rng_engine=rng_engine
+        )
+        your_wins[matches] += is_round_your_win
+        opponent_wins[matches] += ~is_round_your_win
+        is_your_turn_first = ~is_your_turn_first
+        
+    return your_wins > opponent_wins
     
     
 if __name__ == "__main__":
@@ -249,15 +528,32 @@ if __name__ == "__main__":
                         default="./opponent_assignments",
                         required=False)
     parser.add_argument("--out", type=str, default=None)
+    parser.add_argument("--n_matches", type=int, default=1,
+                        help=("The number of matches to play, each with its own seed. "
+                              "Only the win rate is reported when more than one"))
+    parser.add_argument("--workers", type=int, default=None,
+                        help=("The number of processes playing the matches. "
+                              "If left empty, will use every CPU"))
     args = parser.parse_args()
     your_assignments = Path(args.your_assignments)
     opponent_assignments = Path(args.opponent_assignments)
-    rng_engine = RngEngine()
-    match_outcome, description = play_match(your_assignments=your_assignments, 
-               opponent_assignments=opponent_assignments, 
-               rng_engine=rng_engine)
-    if args.out is not None:
-        with open(args.out, "w") as f:
-            print(*description, sep="\n", file=f)
+    if args.n_matches > 1:
+        from functools import partial
+        from multiprocessing import Pool
+        
+        with Pool(args.workers) as pool:
+            n_match_wins = sum(pool.imap_unordered(
+                partial(play_seeded_match, your_assignments, opponent_assignments),
+                range(args.n_matches)))
+        print(f"You won {n_match_wins/args.n_matches * 100:.1f}% "
+              f"({n_match_wins}/{args.n_matches}) of the matches.")
     else:
-        print(*description, sep="\n")
+        rng_engine = RngEngine()
+        match_outcome, description = play_match(your_assignments=your_assignments, 
+                   opponent_assignments=opponent_assignments, 
+                   rng_engine=rng_engine)
+        if args.out is not None:
+            with open(args.out, "w") as f:
+                print(*description, sep="\n", file=f)
+        else:
+            print(*description, sep="\n")
@@ -1,24 +1,61 @@
-import json
 import abc
 from pathlib import Path
-from copy import deepcopy
 from utils import BaseCharacter
+from json_utils import dumps_json, loads_json
 
 N_ROUNDS = 5
 
+# the team data file contents, keyed on their resolved paths
+TEAM_DATA_CACHE: dict[str, bytes] = {}
+
+
+def _read_team_data(team_data_path: Path) -> bytes:
+    """Read the blank team data file once, as the same file is loaded 
+        by every bot playing that match
+
+    Arguments:
+        team_data_path -- the path of the team data file
+
+    Returns:
+        the file content, to be parsed into fresh data by each bot
+    """
+    cache_key = str(team_data_path.resolve())
+    raw_data = TEAM_DATA_CACHE.get(cache_key)
+    if raw_data is None:
+        raw_data = TEAM_DATA_CACHE[cache_key] = team_data_path.read_bytes()
+    return raw_data
+
+
+def preload_team_data(sample_match_dir: Path) -> None:
+    """Read every team data file of the sample matches into the cache upfront,
+        so that worker processes forked afterwards inherit them
+
+    Arguments:
+        sample_match_dir -- the directory containing the sample starting assignments
+    """
+    for team_data_path in sample_match_dir.rglob("team_data.json"):
+        _read_team_data(team_data_path)
+
 
 class BaseBot(abc.ABC):
+    __slots__ = ("assignment_dir", "persist_to_disk", "last_assignment", "characters", "items",
+                 "_previous_character_ordering", "previous_damage_stats", "is_initialized", "current_round")
     
-    def initialize(self, assignment_dir: Path) -> None:
+    def initialize(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
         """Read the blank team data, resetting 
 
         Arguments:
             assignment_dir -- _description_
+            
+        Keyword Arguments:
+            persist_to_disk -- whether write_assignment writes the assignments 
+                to the assignment dir, or only keeps them in last_assignment (default: {True})
         """
         self.assignment_dir = assignment_dir
+        self.persist_to_disk = persist_to_disk
+        self.last_assignment = None
         
-        with open(assignment_dir / "team_data.json", "r") as f:
-            data = json.load(f)
+        data = loads_json(_read_team_data(assignment_dir / "team_data.json"))
         self.characters = data["characters"]
         self.items = data["items"]
         self._previous_character_ordering = self.characters
@@ -26,54 +63,72 @@ class BaseBot(abc.ABC):
         self.is_initialized = True
         self.current_round = 1
         
+    def reset(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
+        """Get the bot ready for a new match, reusing this instance. 
+            Bots keeping their own match state extend it to clear that state too
+
+        Arguments:
+            assignment_dir -- the directory of the blank team data of the new match
+            
+        Keyword Arguments:
+            persist_to_disk -- whether write_assignment writes the assignments 
+                to the assignment dir, or only keeps them in last_assignment (default: {True})
+        """
+        self.initialize(assignment_dir, persist_to_disk)
+        
     @property
     def previous_character_ordering(self) -> list[BaseCharacter]:
-        """Obtain a modifiable copy of the previous round character ordering,
+        """Obtain a reorderable copy of the previous round character ordering,
             useful as a base to make a new assignment
 
+        Only the list is copied, the character data is shared: the items are 
+            placed on new dicts rather than on the character data itself
+        
         Returns:
             the character ordering, a list of character data without any items
         """
-        return deepcopy(self._previous_character_ordering)
+        return list(self._previous_character_ordering)
     
-    def write_assignment(self, assignment: list[dict]) -> None:
+    def write_assignment(self, assignment: list[dict], character_ordering: list[dict]) -> None:
         """Write the team assignment to the current round, 
-        resetting the previous assignment and current round counter
+        resetting the previous assignment and current round counter.
+        The assignment is also kept in last_assignment, to be played without
+        reading it back from disk
 
         Arguments:
             assignment -- the team assignment to write 
+            character_ordering -- the same characters in the same order, without any items
 
         Raises:
             ValueError: if this function in inappropriately called
         """
         if not self.current_round <= N_ROUNDS or not self.is_initialized:
             raise ValueError("Cannot create an assignment with invalid data")
-        with open(self.assignment_dir / f"{self.current_round}.json", "w") as f:
-            json.dump(assignment, f, indent=4)
-        current_assignment = deepcopy(assignment)
-        for char_idx in range(len(current_assignment)):
-            if "items" in current_assignment[char_idx]:
-                del current_assignment[char_idx]["items"]
-        self._previous_character_ordering = current_assignment
+        if self.persist_to_disk:
+            (self.assignment_dir / f"{self.current_round}.json").write_bytes(dumps_json(assignment))
+        self.last_assignment = assignment
+        self._previous_character_ordering = character_ordering
         self.current_round += 1
         
     @abc.abstractmethod
-    def make_assignment(self) -> list[dict]:
+    def make_assignment(self) -> tuple[list[dict], list[dict]]:
         """Create the finalized assignment for this round, reordering the 
             characters and placing the items.
 
         Returns:
-            the mapping (exactly as loaded from the json files in previous labs)
+            a tuple of:
+                - the mapping (exactly as loaded from the json files in previous labs)
+                - the character ordering of the mapping, without any items
         """
         raise NotImplementedError
     
-    @abc.abstractmethod
     def process_previous_round_stats(self, 
                                      is_your_win: bool,
                                      your_team: list[BaseCharacter], 
                                      opponent_team: list[BaseCharacter]) -> None:
         """Process the previous round data, doing anything necessary for 
             make_assignment to work properly in the next round.
+            Does nothing by default, for strategies that do not depend on previous rounds
         
 
         Arguments:
@@ -81,4 +136,4 @@ class BaseBot(abc.ABC):
             your_team -- your team from previous assignment 
             opponent_team -- the opponent's team
         """
-        raise NotImplementedError
+        pass
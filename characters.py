@@ -1,20 +1,17 @@
+from typing import ClassVar
+from functools import cached_property
 from utils import BaseCharacter, Stats, Damage, Attack
 
 class Ninja(BaseCharacter):
-    @property
-    def name(self) -> str:
-        """Returns the name of the character."""
-        return "Ninja"
-    
-    @property
-    def special_attack_name(self) -> str:
-        """Returns the name of the character's special attack."""
-        return (
-            "Special Attack: A precise poisoned dagger shot designed to "
-            "incapacitate most opponents"
-        )
-        
-    @property
+    name: ClassVar[str] = "Ninja"
+    special_attack_name: ClassVar[str] = (
+        "Special Attack: A precise poisoned dagger shot designed to "
+        "incapacitate most opponents"
+    )
+    # base amount, physical and magic power ratios, and what the special attack does
+    SPECIAL_COEFFS: ClassVar[tuple[float, float, float, str]] = (40, .5, .5, "physical")
+
+    @cached_property
     def special_attack(self) -> Attack:
         """
         Performs the Ninja's special attack: A poisoned dagger shot.
@@ -26,26 +23,21 @@ class Ninja(BaseCharacter):
         	Attack: An instance of the Attack class, encapsulating
         	the damage and a description of the attack
         """
+        base, physical_ratio, magic_ratio, _ = self.SPECIAL_COEFFS
         damage = Damage(physical = 
-            40 + .5 * self.effective_stats.physical_power +
-                .5 * self.effective_stats.magic_power
+            base + physical_ratio * self.effective_stats.physical_power +
+                magic_ratio * self.effective_stats.magic_power
             )
         description = (f"{self.name} performed {self.special_attack_name},"
                         f" dealing {damage.physical} Physical Damage.")
         return Attack(damage = damage, description = description)
         
 class Mage(BaseCharacter):
-    @property
-    def name(self) -> str:
-        """Returns the name of the character."""
-        return "Mage"
-    
-    @property
-    def special_attack_name(self) -> str:
-        """Returns the name of the character's special attack."""
-        return "Special Attack: A lullaby to deep sleep"
-    
-    @property
+    name: ClassVar[str] = "Mage"
+    special_attack_name: ClassVar[str] = "Special Attack: A lullaby to deep sleep"
+    SPECIAL_COEFFS: ClassVar[tuple[float, float, float, str]] = (1, 0, 1.25, "magic")
+
+    @cached_property
     def special_attack(self) -> Attack:
         """
         Performs the Mage's special attack: A lullaby to deep sleep.
@@ -57,24 +49,22 @@ class Mage(BaseCharacter):
         	 Attack: An instance of the Attack class, encapsulating
         	 the damage and a description of the attack
         """
-        damage = Damage(magic = 1 + 1.25 * self.effective_stats.magic_power)
+        base, physical_ratio, magic_ratio, _ = self.SPECIAL_COEFFS
+        damage = Damage(magic = 
+            base + physical_ratio * self.effective_stats.physical_power +
+                magic_ratio * self.effective_stats.magic_power
+            )
         description = (f"{self.name} performed {self.special_attack_name},"
                        f" dealing {damage.magic} Magic Damage.")
         return Attack(damage = damage, description = description)
 
 
 class Warrior(BaseCharacter):
-    @property
-    def name(self) -> str:
-        """Returns the name of the character."""
-        return "Warrior"
-    
-    @property
-    def special_attack_name(self) -> str:
-        """Returns the name of the character's special attack."""
-        return "Special Attack: A call to the shield hero"
-    
-    @property
+    name: ClassVar[str] = "Warrior"
+    special_attack_name: ClassVar[str] = "Special Attack: A call to the shield hero"
+    SPECIAL_COEFFS: ClassVar[tuple[float, float, float, str]] = (50, .75, 3, "heal")
+
+    @cached_property
     def special_attack(self) -> Attack:
         """
         Performs the Warrior's special attack: A call to the shield hero.
@@ -87,10 +77,18 @@ class Warrior(BaseCharacter):
         	Attack: An instance of the Attack class, encapsulating
         	the stat updates to self and a description of the attack
         """
-        healing_done = (50 + .75 * self.effective_stats.physical_power +
-                        3 * self.effective_stats.magic_power)
+        base, physical_ratio, magic_ratio, _ = self.SPECIAL_COEFFS
+        healing_done = (base + physical_ratio * self.effective_stats.physical_power +
+                        magic_ratio * self.effective_stats.magic_power)
         description = (f"{self.name} performed {self.special_attack_name},"
                        f" healing {healing_done} HP.")
         return Attack(stat_updates_to_self = Stats(current_hp = healing_done),  
                       description = description)
-    
\ No newline at end of file
+
+
+# maps the character names used in the assignment files to their classes
+CHARACTER_REGISTRY = {
+    "ninja": Ninja,
+    "mage": Mage,
+    "warrior": Warrior
+}
@@ -1,21 +1,140 @@
 from pathlib import Path
-import json
-from utils import BaseCharacter, Stats
-from characters import Ninja, Warrior, Mage
-from items import EnchantedSword, ShinyStaff, Pole, MagicCauldron, SolidRock
-
-CHARACTER_MAPPING = {
-    "ninja": Ninja,
-    "mage": Mage,
-    "warrior": Warrior
-}
-ITEM_MAPPING = {
-    "enchanted_sword": EnchantedSword,
-    "shiny_staff": ShinyStaff,
-    "pole": Pole,
-    "magic_cauldron": MagicCauldron,
-    "solid_rock": SolidRock
-}
+from functools import lru_cache
+from json_utils import loads_json
+import numpy as np
+from utils import BaseCharacter, BaseItem, Stats, N_ITEMS, apply_item_effects
+from characters import CHARACTER_REGISTRY
+from items import ITEM_REGISTRY
+
+CHARACTER_MAPPING = CHARACTER_REGISTRY
+ITEM_MAPPING = ITEM_REGISTRY
+
+
+TeamTemplate = tuple[tuple[type[BaseCharacter], Stats, tuple[tuple[type[BaseItem], Stats], ...]], ...]
+
+
+def read_stats(stats_data: dict) -> Stats:
+    """
+    Creates the stats from their assignment data, where "hp" stands for both
+    the current and total hp. The data itself is left untouched.
+
+    Args:
+        stats_data: The stats as found in the assignment data.
+
+    Returns:
+        The corresponding Stats.
+    """
+    stats_data = dict(stats_data)
+    if "hp" in stats_data:
+        hp = stats_data.pop("hp")
+        stats_data.update({"current_hp": hp, "total_hp": hp})
+    return Stats(**stats_data)
+
+
+def make_team_template(assignment: list[dict]) -> TeamTemplate:
+    """
+    Turns a team assignment into an immutable team template: the character
+    class and base stats of each character, along with the class and stats
+    of each of their items. The assignment itself is left untouched.
+
+    Args:
+        assignment: The team assignment, as loaded from the JSON data file.
+
+    Returns:
+        A tuple of (character class, base stats, items) per character, where
+        items is a tuple of (item class, item stats).
+    """
+    characters = []
+    for character_data in assignment:
+        character_name = character_data["character"]["name"]
+        character_stats = read_stats(character_data["character"]["stats"])
+        items = tuple((ITEM_MAPPING[item_data["name"]], read_stats(item_data["stats"]))
+                      for item_data in character_data.get("items", []))
+        characters.append((CHARACTER_MAPPING[character_name], character_stats, items))
+    return tuple(characters)
+
+
+@lru_cache(maxsize=256)
+def parse_team_assignment(raw_assignment: bytes) -> TeamTemplate:
+    """
+    Parses the content of a team assignment JSON file into a team template.
+
+    The result is cached on the file content, so assignments played again
+    skip the JSON parsing, while rewritten assignment files are parsed anew.
+
+    Args:
+        raw_assignment: The content of the JSON data file.
+
+    Returns:
+        The team template, as made by make_team_template.
+    """
+    return make_team_template(loads_json(raw_assignment))
+
+
+def build_team(team_template: TeamTemplate) -> list[BaseCharacter]:
+    """
+    Creates fresh character and item instances from a team template,
+    equipping each character with their own items.
+
+    Args:
+        team_template: The team template, as made by make_team_template.
+
+    Returns:
+        A list of character instances.
+    """
+    characters = []
+    for character_class, character_stats, items in team_template:
+        character = character_class(base_stats = character_stats)
+        for item_class, item_stats in items:
+            character.add_item(item_class(base_item_stats = item_stats))
+        characters.append(character)
+    return characters
+
+
+def team_effective_stats(team_template: TeamTemplate) -> np.ndarray:
+    """
+    Calculates the effective stats of each character of a team template,
+    the same ones as the characters made by build_team, without creating them.
+
+    Args:
+        team_template: The team template, as made by make_team_template.
+
+    Returns:
+        An array of the effective stats of each character, one column per Stats field.
+
+    Raises:
+        ValueError: If a character has more items than allowed in game.
+    """
+    n_items = max((len(items) for _, _, items in team_template), default=0)
+    base_stats = np.array([character_stats for _, character_stats, _ in team_template], 
+                          dtype=np.float64).reshape(-1, len(Stats._fields))
+    item_effects = np.zeros((len(team_template), n_items, len(Stats._fields)))
+    for char_idx, (_, character_stats, items) in enumerate(team_template):
+        if len(items) > N_ITEMS:
+            raise ValueError("Attempted to add more items than allowed in game.")
+        item_names = set()
+        for item_idx, (item_class, item_stats) in enumerate(items):
+            # a unique passive only works for the first item of its kind, as in add_item
+            is_passive_active = not (item_class.has_unique_passive and item_class.name in item_names)
+            item_names.add(item_class.name)
+            item_effects[char_idx, item_idx] = item_class(item_stats, is_passive_active).cached_effective_stats(
+                character_stats)
+    return apply_item_effects(base_stats, item_effects)
+
+
+def read_team_template(team_assignment: Path) -> TeamTemplate:
+    """
+    Reads the team template of a JSON data file.
+
+    Args:
+        team_assignment: Path to the JSON data file.
+
+    Returns:
+        The team template, as made by make_team_template.
+    """
+    with open(team_assignment, "rb") as f:
+        raw_assignment = f.read()
+    return parse_team_assignment(raw_assignment)
 
 
 def read_data(team_assignment: Path) -> list[BaseCharacter]:
@@ -29,32 +148,7 @@ def read_data(team_assignment: Path) -> list[BaseCharacter]:
     Returns:
         A list of character instances.
     """
-    with open(team_assignment, "r") as f:
-        read_assignment = json.load(f)
-        
-    characters = []
-    for character_data in read_assignment:
-        character_name = character_data["character"]["name"]
-        character_stats = character_data["character"]["stats"]
-        character_stats.update({"current_hp": character_stats["hp"], 
-                                "total_hp": character_stats["hp"]})
-        del character_stats["hp"]
-        character_stats = Stats(**character_stats)
-        character = CHARACTER_MAPPING[character_name](base_stats = character_stats)
-        if "items" in character_data:
-            for item_data in character_data["items"]:
-                item_name = item_data["name"]
-                item_stats = item_data["stats"]
-                if "hp" in item_stats:
-                    item_stats.update({"current_hp": item_stats["hp"], 
-                                        "total_hp": item_stats["hp"]})
-                    del item_stats["hp"]
-                item_stats = Stats(**item_stats)
-                item = ITEM_MAPPING[item_name](base_item_stats = item_stats)
-                character.add_item(item)
-        characters.append(character)
-        
-    return characters   
+    return build_team(read_team_template(team_assignment))
 
 
 if __name__ == "__main__":
@@ -1,17 +1,11 @@
+from typing import ClassVar
 from utils import BaseItem, Stats
 
 class EnchantedSword(BaseItem):
-    @property
-    def name(self) -> str:
-        """Returns the name of the item."""
-        return "Enchanted Sword"
-    
-    @property
-    def passive_name(self) -> str:
-        """Returns the name of the item and its special ability."""
-        return ("Unique Passive: Lucky strike. Adds 5%(+25% of base Special "
-                "Trigger Chance) to Special Trigger chance.")
-        
+    name: ClassVar[str] = "Enchanted Sword"
+    passive_name: ClassVar[str] = ("Unique Passive: Lucky strike. Adds 5%(+25% of base Special "
+                                   "Trigger Chance) to Special Trigger chance.")
+
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Calculates the effective stats after equipping the item.
@@ -34,17 +28,10 @@ class EnchantedSword(BaseItem):
         
         
 class ShinyStaff(BaseItem):
-    @property
-    def name(self) -> str:
-        """Returns the name of the item."""
-        return "Shiny Staff"
-    
-    @property
-    def passive_name(self) -> str:
-        """Returns the name of the item and its special ability."""
-        return ("Passive: Blessings of Echo. Adds 1(+50% of base Magic Power)"
-                " to Magic Power.")
-        
+    name: ClassVar[str] = "Shiny Staff"
+    passive_name: ClassVar[str] = ("Passive: Blessings of Echo. Adds 1(+50% of base Magic Power)"
+                                   " to Magic Power.")
+
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Calculates the effective stats after equipping the item.
@@ -64,16 +51,9 @@ class ShinyStaff(BaseItem):
     
     
 class MagicCauldron(BaseItem):
-    @property
-    def name(self) -> str:
-        """Returns the name of the item."""
-        return "A magic cauldron"
-    
-    @property
-    def passive_name(self) -> str:
-        """Returns the name of the item and its special ability."""
-        return ("Unique Passive: Potion of life. Adds 10(+30% of base HP) to HP")
-    
+    name: ClassVar[str] = "A magic cauldron"
+    passive_name: ClassVar[str] = "Unique Passive: Potion of life. Adds 10(+30% of base HP) to HP"
+
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Calculates the effective stats after equipping the item.
@@ -95,16 +75,9 @@ class MagicCauldron(BaseItem):
         return self.base_item_stats.add_stat_changes(passive_stats)
     
 class Pole(BaseItem):
-    @property
-    def name(self) -> str:
-        """Returns the name of the item."""
-        return "A Pole"
-    
-    @property
-    def passive_name(self) -> str:
-        """Returns the name of the item and its special ability."""
-        return ""
-     
+    name: ClassVar[str] = "A Pole"
+    passive_name: ClassVar[str] = ""
+
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Calculates the effective stats after equipping the item.
@@ -122,16 +95,9 @@ class Pole(BaseItem):
     
     
 class SolidRock(BaseItem):
-    @property
-    def name(self) -> str:
-        """Returns the name of the item."""
-        return "A solid rock"
-    
-    @property
-    def passive_name(self) -> str:
-        """Returns the name of the item and its special ability."""
-        return ""
-    
+    name: ClassVar[str] = "A solid rock"
+    passive_name: ClassVar[str] = ""
+
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Calculates the effective stats after equipping the item.
@@ -146,3 +112,13 @@ class SolidRock(BaseItem):
         	Stats: The new character stats after equipping the item.
         """
         return self.base_item_stats
+
+
+# maps the item names used in the assignment files to their classes
+ITEM_REGISTRY = {
+    "enchanted_sword": EnchantedSword,
+    "shiny_staff": ShinyStaff,
+    "pole": Pole,
+    "magic_cauldron": MagicCauldron,
+    "solid_rock": SolidRock
+}
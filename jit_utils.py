@@ -0,0 +1,15 @@
+try:
+    from numba import njit, prange
+    IS_JIT_AVAILABLE = True
+except ImportError:  # numba is optional, jitted functions then run as plain python
+    IS_JIT_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed,
+            leaving the decorated function untouched.
+            Works both as @njit and @njit(...)
+        """
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda function: function
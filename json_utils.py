@@ -0,0 +1,35 @@
+import json
+
+try:
+    import orjson
+    IS_ORJSON_AVAILABLE = True
+except ImportError:  # orjson is optional, the standard json module is used instead
+    IS_ORJSON_AVAILABLE = False
+
+
+def dumps_json(data) -> bytes:
+    """Serialize the data to indented JSON bytes, with orjson if installed
+
+    Arguments:
+        data -- the JSON-compatible data to serialize
+
+    Returns:
+        the encoded JSON document
+    """
+    if IS_ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def loads_json(raw_data: bytes | str):
+    """Parse a JSON document, with orjson if installed
+
+    Arguments:
+        raw_data -- the encoded JSON document
+
+    Returns:
+        the decoded data
+    """
+    if IS_ORJSON_AVAILABLE:
+        return orjson.loads(raw_data)
+    return json.loads(raw_data)
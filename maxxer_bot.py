@@ -1,5 +1,4 @@
 from pathlib import Path
-from utils import BaseCharacter
 from bot_utils import BaseBot
 
 STAT_TO_MAX = {
@@ -19,9 +18,10 @@ class MaxxerBot(BaseBot):
 
 	Methods:
 		make_assignment(): Determines the position and items of each character in your team.
-		process_previous_round_stats(): Processes the results of the previous round to inform the next assignments.
-		In this case it's a blank method since the strategy doesn't depend on it.
+		process_previous_round_stats(): Inherited as a blank method from BaseBot, since the strategy doesn't depend on it.
 	"""
+    __slots__ = ("character_to_max", "_best_character_ids")
+
     def __init__(self, character_to_max: str) -> None:
         """
 		Initializes an instance of the MaxxerBot class, setting the character name to be maximized.
@@ -31,7 +31,24 @@ class MaxxerBot(BaseBot):
 		"""
         self.character_to_max = character_to_max
 
-    def make_assignment(self) -> list[dict]:
+    def initialize(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
+        """
+		Reads the blank team data, then finds the characters to maximize once for the whole match,
+		as the roster and its stats stay the same from round to round.
+
+		Args:
+			assignment_dir (Path): The directory of the team data and assignments.
+			persist_to_disk (bool): Whether the assignments are written to the assignment dir.
+		"""
+        super().initialize(assignment_dir, persist_to_disk)
+        stat_to_maximize = STAT_TO_MAX[self.character_to_max]
+        candidates = [char["character"] for char in self.characters 
+                      if char["character"]["name"] == self.character_to_max]
+        best_stat = max((char["stats"][stat_to_maximize] for char in candidates), default=None)
+        # every character tied on the best stat, the first one in the current ordering is picked
+        self._best_character_ids = {id(char) for char in candidates if char["stats"][stat_to_maximize] == best_stat}
+
+    def make_assignment(self) -> tuple[list[dict], list[dict]]:
         """
 		Creates an assignment of characters and items.
 
@@ -39,39 +56,47 @@ class MaxxerBot(BaseBot):
 		items to this character. If the character is not in your team, the last character in your team gets all the items.
 
 		Returns:
-			list[dict]: A list of dictionaries, each representing an assignment for a character.
+			tuple[list[dict], list[dict]]: A list of dictionaries, each representing an assignment for a character,
+				and the same list without the items.
 		"""
         assignment = self.previous_character_ordering
         
-        candidates = [(char_idx, char) for char_idx, char 
-                      in enumerate(assignment)
-                      if char["character"]["name"] == self.character_to_max]
-        if candidates:
-            stat_to_maximize = STAT_TO_MAX[self.character_to_max]
-            best_char_idx, best_char = max(
-                candidates, key=lambda x: x[1]["character"]["stats"][stat_to_maximize])
-        else:
-            best_char_idx = 0  # no main characters found :(
+        # stays 0 if no main characters are found :(
+        best_char_idx = next((char_idx for char_idx, char in enumerate(assignment) 
+                              if id(char["character"]) in self._best_character_ids), 0)
         
         assignment.insert(-1, assignment.pop(best_char_idx))
-        assignment[-1]["items"] = self.items
-        
-        return assignment
+        character_ordering = list(assignment)
+        assignment[-1] = {**assignment[-1], "items": self.items}
         
-    def process_previous_round_stats(self, 
-                                     is_your_win: bool, 
-                                     your_team: list[BaseCharacter], 
-                                     opponent_team: list[BaseCharacter]) -> None:
-        """
-		Method to process the results of the previous round.
+        return assignment, character_ordering
 
-		This is a mandatory method for all bots, but it's not used by MaxxerBot, because the strategy
-		doesn't depend on the outcome of previous rounds.
-		"""
-        pass
-            
-    
-    
-    
-        
-        
\ No newline at end of file
+
+class WarriorMaxxerBot(MaxxerBot):
+    """
+	MaxxerBot maximizing the hp of a warrior.
+	"""
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("warrior")
+
+
+class MageMaxxerBot(MaxxerBot):
+    """
+	MaxxerBot maximizing the magic power of a mage.
+	"""
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("mage")
+
+
+class NinjaMaxxerBot(MaxxerBot):
+    """
+	MaxxerBot maximizing the physical power of a ninja.
+	"""
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__("ninja")
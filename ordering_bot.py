@@ -1,3 +1,5 @@
+from pathlib import Path
+import numpy as np
 from utils import BaseCharacter
 from bot_utils import BaseBot
 
@@ -8,22 +10,36 @@ class HeadOnBot(BaseBot):
     opponent's high damage-dealing characters with our equivalent ones.
 
     Attributes:
-        opponent_damage_dealers: List of tuples (character_index, damage_dealt) in the opponent team
-        team_damage_dealers: List of tuples (character_index, damage_dealt) in our team
+        opponent_damage: Array of the damage dealt by each character in the opponent team
+        team_damage: Array of the damage dealt by each character in our team
 
     Methods:
         make_assignment(): Determines the position and items of each character in your team.
         process_previous_round_stats(): Processes the results of the previous round to inform the next assignments.
     """
+    __slots__ = ("opponent_damage", "team_damage")
+
     def __init__(self) -> None:
         """
 		Initializes an instance of the HeadOnBot class,
-		sets lists of damage dealers for both opponent and our team to empty.
+		sets the damage dealt for both opponent and our team to empty.
+		"""
+        self.opponent_damage = np.empty(0, dtype=np.float64)
+        self.team_damage = np.empty(0, dtype=np.float64)
+
+    def reset(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
+        """
+		Gets the bot ready for a new match, also forgetting the damage dealt in the previous match.
+
+		Args:
+			assignment_dir (Path): The directory of the blank team data of the new match.
+			persist_to_disk (bool): Whether the assignments are written to the assignment dir.
 		"""
-        self.opponent_damage_dealers = []
-        self.team_damage_dealers = []
+        super().reset(assignment_dir, persist_to_disk)
+        self.opponent_damage = np.empty(0, dtype=np.float64)
+        self.team_damage = np.empty(0, dtype=np.float64)
     
-    def make_assignment(self) -> list[dict]:
+    def make_assignment(self) -> tuple[list[dict], list[dict]]:
         """
 		Creates an assignment of characters and items based on damage dealt.
 
@@ -32,32 +48,36 @@ class HeadOnBot(BaseBot):
 		go to the highest damage dealer from the opposing team.
 
 		Returns:
-			list[dict]: A list of dictionaries, each representing an assignment for a character.
+			tuple[list[dict], list[dict]]: A list of dictionaries, each representing an assignment for a character,
+				and the same list without the items.
 		"""
         
         assignment = self.previous_character_ordering
         highest_damage_char_idx = 0
         
-        if self.team_damage_dealers:
-            previous_order = self.previous_character_ordering
-            self.team_damage_dealers.sort(key = lambda x: x[1])
-            self.opponent_damage_dealers.sort(key = lambda x: x[1])
-            for damage_dealer_idx in range(len(self.team_damage_dealers)):
-                team_char_idx, _ = self.team_damage_dealers[damage_dealer_idx]
-                placement_idx, _ = self.opponent_damage_dealers[damage_dealer_idx]
-                assignment[placement_idx] = previous_order[team_char_idx]
-            highest_damage_char_idx, _ = self.opponent_damage_dealers[-1] 
+        if self.team_damage.size:
+            previous_order = assignment
+            # stable sorts, so that ties keep their team order
+            team_order = np.argsort(self.team_damage, kind="stable")
+            opponent_order = np.argsort(self.opponent_damage, kind="stable")
+            # the previous index of the character placed at each position, scattered in one go
+            placement = np.arange(len(previous_order))
+            n_placed = min(len(team_order), len(opponent_order))
+            placement[opponent_order[:n_placed]] = team_order[:n_placed]
+            assignment = [previous_order[char_idx] for char_idx in placement.tolist()]
+            highest_damage_char_idx = int(opponent_order[-1])
         
-        assignment[highest_damage_char_idx]["items"] = self.items
+        character_ordering = list(assignment)
+        assignment[highest_damage_char_idx] = {**assignment[highest_damage_char_idx], "items": self.items}
             
-        return assignment
+        return assignment, character_ordering
     
     def process_previous_round_stats(self,
                                      is_your_win: bool, 
                                      your_team: list[BaseCharacter], 
                                      opponent_team: list[BaseCharacter]) -> None:
         """
-		Updates lists of damage dealers for both teams based on the results of a previous round.
+		Updates the damage dealt for both teams based on the results of a previous round.
 
 		Args:
 			is_your_win (bool): True if our team won in the last round, False otherwise
@@ -65,10 +85,10 @@ class HeadOnBot(BaseBot):
 			opponent_team (list[BaseCharacter]): List of opponent characters after the last round
 		"""
         
-        self.opponent_damage_dealers = [(char_idx, char.damage_stats.damage_dealt)
-                                        for char_idx, char in enumerate(opponent_team)]
-        self.team_damage_dealers = [(char_idx, char.damage_stats.damage_dealt)
-                                        for char_idx, char in enumerate(your_team)]
+        self.opponent_damage = np.fromiter((char.damage_stats.damage_dealt for char in opponent_team),
+                                           dtype=np.float64, count=len(opponent_team))
+        self.team_damage = np.fromiter((char.damage_stats.damage_dealt for char in your_team),
+                                       dtype=np.float64, count=len(your_team))
     
     
         
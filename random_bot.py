@@ -1,6 +1,6 @@
-from utils import BaseCharacter
+import random
+from pathlib import Path
 from bot_utils import BaseBot
-import numpy as np
 
 
 class RandomBot(BaseBot):
@@ -15,9 +15,10 @@ class RandomBot(BaseBot):
 
     Methods:
         make_assignment(): Determines the position and items of each character in your team.
-        process_previous_round_stats(): Processes the results of the previous round to inform the next assignments.
-        In this case it's a blank method since the strategy doesn't depend on it.
+        process_previous_round_stats(): Inherited as a blank method from BaseBot, since the strategy doesn't depend on it.
     """
+    __slots__ = ("seed", "rand")
+
     def __init__(self, seed: int = 16) -> None:
         """
 		Initializes an instance of the RandomBot class, setting the seed for the random number generator.
@@ -25,35 +26,39 @@ class RandomBot(BaseBot):
 		Args:
 			seed (int): The seed for the random number generator. Defaults to 16.
 		"""
-        self.rand = np.random.default_rng(seed)
+        self.seed = seed
+        self.rand = random.Random(seed)
+
+    def reset(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
+        """
+		Gets the bot ready for a new match, reseeding the random number generator
+		so that every match plays out as with a new bot.
+
+		Args:
+			assignment_dir (Path): The directory of the blank team data of the new match.
+			persist_to_disk (bool): Whether the assignments are written to the assignment dir.
+		"""
+        super().reset(assignment_dir, persist_to_disk)
+        self.rand.seed(self.seed)
         
-    def make_assignment(self) -> list[dict]:
+    def make_assignment(self) -> tuple[list[dict], list[dict]]:
         """
 		Creates an assignment of characters and items.
 
 		This method randomly shuffles the order of the characters and randomly assigns items to the characters.
 
 		Returns:
-			list[dict]: A list of dictionaries, each representing assignments for a character.
+			tuple[list[dict], list[dict]]: A list of dictionaries, each representing assignments for a character,
+				and the same list without the items.
 		"""
         assignment = self.previous_character_ordering
         self.rand.shuffle(assignment)
-        item_assignments = self.rand.choice(len(assignment), size=(len(self.items),))
-        for item_idx, char_idx in enumerate(item_assignments):
-            if not "items" in assignment[char_idx]:
-                assignment[char_idx]["items"] = []
-            assignment[char_idx]["items"].append(self.items[item_idx])
+        character_ordering = list(assignment)
+        item_assignments = self.rand.choices(range(len(assignment)), k=len(self.items))
+        char_items = {}
+        for item, char_idx in zip(self.items, item_assignments):
+            char_items.setdefault(char_idx, []).append(item)
+        for char_idx, items in char_items.items():
+            assignment[char_idx] = {**assignment[char_idx], "items": items}
         
-        return assignment
-    
-    def process_previous_round_stats(self, 
-                                     is_your_win: bool, 
-                                     your_team: list[BaseCharacter], 
-                                     opponent_team: list[BaseCharacter]) -> None:
-        """
-		Method to process the results of the previous round.
-
-		This is a mandatory method for all bots, but it's not used by RandomBot, because the strategy
-		doesn't depend on previous rounds' results.
-		"""
-        pass
+        return assignment, character_ordering
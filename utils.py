@@ -1,10 +1,21 @@
-from typing import NamedTuple
-import abc
+from typing import ClassVar, NamedTuple
 import math
+import sys
 import numpy as np
 from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from jit_utils import njit, IS_JIT_AVAILABLE
 
 N_ITEMS = 3
+N_BUFFERED_ROLLS = 4096
+CACHED_ATTACKS = ("basic_attack", "special_attack")
+# the upper bound of each stat in field order, all of them being at least 0, 
+# as normalized by Stats.add_stat_changes. The current hp is also capped by the total hp.
+STAT_MAXIMA = (math.inf, math.inf, math.inf, math.inf, math.inf, math.inf, 100)
+STAT_MAXIMA_ARRAY = np.array(STAT_MAXIMA, dtype=np.float64)
+# the formatted name of each stat in field order
+STAT_LABELS = ("Current HP", "Total HP", "Armor", "Magic Resistance", 
+               "Physical Power", "Magic Power", "Special Trigger Chance")
 
 
 class RngEngine:
@@ -18,6 +29,12 @@ class RngEngine:
             seed -- the pseudo rng seed to use (default: {56})
         """
         self._rand = np.random.default_rng(seed=seed)
+        # the dice of rng are drawn from the generator in bulk, yielding the same
+        # sequence as drawing them one by one. They are drawn into the same buffer
+        # each time rather than into a newly allocated array.
+        self._roll_buffer = np.empty(N_BUFFERED_ROLLS, dtype=np.float64)
+        self._rolls = []
+        self._roll_idx = 0
 
     def rng(self, probability: float) -> bool:
         """Roll a dice with the probability and see if the result is
@@ -33,7 +50,64 @@ class RngEngine:
             Whether or not the expected outcome was rolled. 
                 True if it was, False otherwise
         """
-        return self._rand.random() < (probability / 100)
+        if self._roll_idx == len(self._rolls):
+            self._rand.random(out=self._roll_buffer)
+            self._rolls = self._roll_buffer.tolist()
+            self._roll_idx = 0
+        roll = self._rolls[self._roll_idx]
+        self._roll_idx += 1
+        return roll < (probability / 100)
+
+    def rng_many(self, probability: np.ndarray) -> np.ndarray:
+        """Roll one dice per entry of probability, the batched version of rng.
+
+            NOTE: DO NOT call this function. 
+                It is already called where needed 
+
+        Arguments:
+            probability -- the probabilities of rolling the expected outcomes, numbers from [0-100]
+
+        Returns:
+            A boolean array, True where the expected outcome was rolled
+        """
+        uniforms = self._rand.random(np.shape(probability))
+        if IS_JIT_AVAILABLE:
+            return bernoulli_batch(uniforms.ravel(), np.ravel(probability)).reshape(uniforms.shape)
+        return uniforms < (probability / 100)
+
+    def uniforms(self, shape: int | tuple[int, ...]) -> np.ndarray:
+        """Draw the dice ahead of time, as uniform numbers from [0-1). 
+            An outcome of probability p is rolled when its number is below p / 100.
+
+            NOTE: DO NOT call this function. 
+                It is already called where needed 
+
+        Arguments:
+            shape -- the shape of the array of dice to draw
+
+        Returns:
+            The array of uniform numbers
+        """
+        return self._rand.random(shape)
+
+
+@njit(cache=True)
+def bernoulli_batch(uniforms: np.ndarray, probability: np.ndarray) -> np.ndarray:
+    """
+    Rolls many dice at once from their uniform numbers, in one compiled loop
+    rather than one RngEngine.rng call per dice.
+
+    Args:
+    	uniforms (np.ndarray): The uniform numbers from [0-1) of the dice, as drawn by RngEngine.uniforms.
+    	probability (np.ndarray): The probability of rolling the expected outcome of each dice, from [0-100].
+
+    Returns:
+    	np.ndarray: A boolean array, True where the expected outcome was rolled.
+    """
+    is_rolled = np.empty(uniforms.size, dtype=np.bool_)
+    for roll_idx in range(uniforms.size):
+        is_rolled[roll_idx] = uniforms[roll_idx] < (probability[roll_idx] / 100)
+    return is_rolled
 
 
 class Stats(NamedTuple):
@@ -60,38 +134,108 @@ class Stats(NamedTuple):
         	The current HP cannot exceed total HP and is ensured to be at least 0.
         	The special trigger chance is capped at 100.
         """
-        new_stats = {}
-        for stat_name, [min_val, max_val] in [
-                ["total_hp", [0, math.inf]],
-                ["current_hp", [0, "total_hp"]],
-                ["armor", [0, math.inf]],
-                ["magic_resistance", [0, math.inf]],
-                ["physical_power", [0, math.inf]],
-                ["magic_power", [0, math.inf]],
-                ["special_trigger_chance", [0, 100]]]:
-            new_stat = getattr(self, stat_name) + getattr(changes, stat_name)
-            if max_val == "total_hp":
-                max_val = new_stats["total_hp"]  # to cap current hp to new max hp
-            normalized_stat = min(max_val, max(min_val, new_stat))
-            new_stats[stat_name] = normalized_stat
-        return Stats(**new_stats)
+        total_hp = max(0, self.total_hp + changes.total_hp)
+        return Stats(min(total_hp, max(0, self.current_hp + changes.current_hp)),  # to cap current hp to new max hp
+                     total_hp,
+                     max(0, self.armor + changes.armor),
+                     max(0, self.magic_resistance + changes.magic_resistance),
+                     max(0, self.physical_power + changes.physical_power),
+                     max(0, self.magic_power + changes.magic_power),
+                     min(100, max(0, self.special_trigger_chance + changes.special_trigger_chance)))
+
+    def add_hp_change(self, hp_change: float) -> "Stats":
+        """
+        Updates only the current HP, the one stat that changes during combat.
+        This is the same as add_stat_changes with Stats(current_hp=hp_change),
+        without building the changes or normalizing the other stats.
+
+        Args:
+        	hp_change (float): The HP to add, negative for damage.
+
+        Returns:
+        	Stats: The updated stats, with current HP kept within [0, total HP].
+        """
+        current_hp = min(self.total_hp, max(0, self.current_hp + hp_change))
+        return Stats(current_hp, *self[1:])
+
+    def format(self, separator: str = "\n") -> str:
+        """
+        Formats every stat with its name, one after the other.
+
+        Args:
+        	separator (str): The separator between the stats, defaults to a new line.
+
+        Returns:
+        	str: The formatted stats.
+        """
+        return separator.join([f"{formatted_name}: {stat:.1f}"
+                               for formatted_name, stat in zip(STAT_LABELS, self)])
 
     def __str__(self) -> str:
         """
         Returns a formatted string providing detailed information about the object's attributes.
         """
-        formatted_stats = [f"{formatted_name}: {stat:.1f}"
-            for formatted_name, stat in [
-                ["Current HP", self.current_hp],
-                ["Total HP", self.total_hp],
-                ["Armor", self.armor],
-                ["Magic Resistance", self.magic_resistance],
-                ["Physical Power", self.physical_power],
-                ["Magic Power", self.magic_power],
-                ["Special Trigger Chance", self.special_trigger_chance]
-            ]
-        ]
-        return "\n".join(formatted_stats)
+        return self.format()
+
+
+
+# the stats as a numpy record, one float field per Stats field
+STAT_DTYPE = np.dtype([(field, np.float64) for field in Stats._fields])
+
+
+def team_stats_array(team: list["BaseCharacter"]) -> np.ndarray:
+    """
+    Gathers the effective stats of a whole team in one structured array,
+    so that a stat of every character is read as a single column.
+
+    Args:
+    	team (list[BaseCharacter]): The characters of the team.
+
+    Returns:
+    	np.ndarray: The effective stats of each character, of dtype STAT_DTYPE.
+    """
+    return np.array([char.effective_stats for char in team], dtype=STAT_DTYPE)
+
+
+@njit(cache=True)
+def add_stat_changes_batch(stats: np.ndarray, changes: np.ndarray) -> np.ndarray:
+    """
+    The array counterpart of Stats.add_stat_changes, applying the changes
+    to many stats at once with the same normalization.
+
+    Args:
+    	stats (np.ndarray): The stats, one row of Stats fields each, of shape (n, 7).
+    	changes (np.ndarray): The stat changes to apply to each row, of the same shape.
+
+    Returns:
+    	np.ndarray: The updated stats after the changes have been applied.
+    """
+    new_stats = np.empty_like(stats)
+    for row in range(stats.shape[0]):
+        for col in range(stats.shape[1]):
+            new_stats[row, col] = min(STAT_MAXIMA_ARRAY[col], max(0.0, stats[row, col] + changes[row, col]))
+        new_stats[row, 0] = min(new_stats[row, 0], new_stats[row, 1])  # to cap current hp to new max hp
+    return new_stats
+
+
+@njit(cache=True)
+def apply_item_effects(base_stats: np.ndarray, item_effects: np.ndarray) -> np.ndarray:
+    """
+    Applies the effective stats of the items to many characters at once,
+    the same way adding them one after the other with add_item does.
+
+    Args:
+    	base_stats (np.ndarray): The base stats of each character, of shape (n, 7).
+    	item_effects (np.ndarray): The effective stats of each item of each character,
+    	of shape (n, k, 7), left at 0 for the characters with fewer items.
+
+    Returns:
+    	np.ndarray: The effective stats of each character, of shape (n, 7).
+    """
+    effective_stats = base_stats.copy()
+    for item_idx in range(item_effects.shape[1]):
+        effective_stats = add_stat_changes_batch(effective_stats, item_effects[:, item_idx])
+    return effective_stats
 
 
 class Damage(NamedTuple):
@@ -121,7 +265,7 @@ class Attack(NamedTuple):
     description: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DamageStats:
     """
         The DamageStats class tracks and aggregates damage-related statistics for characters during a round.
@@ -144,15 +288,33 @@ class DamageStats:
     kills: int = 0
 
 
-class BaseItem(abc.ABC):
+class BaseItem:
     """
     BaseItem is an abstract base class the represents a generic
     item in a game. Specific items should inherit from this class
     and customize the 'name', 'passive_name', and 'calculate_effective_stats'
     methods to match their individual behaviors.
 
-    The class serves as a contract for what each item should include
+    The class serves as a contract for what each item should include.
+    It is a plain class rather than an abc.ABC, keeping item construction
+    and isinstance checks cheap; its abstract members raise NotImplementedError.
     """
+    # whether the passive of the item class only works once per character
+    has_unique_passive: ClassVar[bool] = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """
+        Flags the item classes with a unique passive once, when they are
+        defined, rather than searching their passive name on every item added.
+        Their names are interned, so that comparing items by name compares
+        the same string object.
+        """
+        super().__init_subclass__(**kwargs)
+        if isinstance(cls.__dict__.get("name"), str):
+            cls.name = sys.intern(cls.name)
+        if isinstance(cls.__dict__.get("passive_name"), str):
+            cls.has_unique_passive = "Unique Passive" in cls.passive_name
+
     def __init__(self, base_item_stats: Stats,
                  is_passive_active: bool = True) -> None:
         """
@@ -167,34 +329,33 @@ class BaseItem(abc.ABC):
         self.is_passive_active = is_passive_active
 
     @property
-    @abc.abstractmethod
     def name(self) -> str:
         """
         Abstract method representing a 'name' property.
 
         This method is intended to be overridden in subclasses to
-        return the name of the item as a string.
+        return the name of the item as a string, typically with a
+        plain class attribute.
 
         Returns:
         	str: The name of the item
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
     def passive_name(self) -> str:
         """
         Abstract method representing a 'passive_name' property
 
         This property is intended to be overridden in subclasses to
-        return the passive name of the item as a string.
+        return the passive name of the item as a string, typically with
+        a plain class attribute.
 
         Returns:
         	str: The name and passive effect of the item.
         """
-        pass
+        raise NotImplementedError
 
-    @abc.abstractmethod
     def calculate_effective_stats(self, character_stats: Stats) -> Stats:
         """
         Abstract method to calculate effective statistics.
@@ -210,7 +371,23 @@ class BaseItem(abc.ABC):
         Returns:
         	Stats: The calculated statistics after applying the item effect.
         """
-        pass
+        raise NotImplementedError
+
+    def cached_effective_stats(self, character_stats: Stats) -> Stats:
+        """
+        Returns the same stats as calculate_effective_stats, memoized on
+        everything they depend on: the item class, its base stats, whether
+        its passive is active and the character stats.
+
+        Args:
+        	character_stats (Stats): The original statistics of a
+        	character before applying the item effect.
+
+        Returns:
+        	Stats: The calculated statistics after applying the item effect.
+        """
+        return _calculate_item_effective_stats(type(self), self.base_item_stats,
+                                               self.is_passive_active, character_stats)
 
     def __eq__(self, value: object) -> bool:
         """
@@ -241,20 +418,35 @@ class BaseItem(abc.ABC):
             Returns:
                 str: A string representation of the BaseItem object.
             """
-        stats = str(self.base_item_stats).split("\n")
-        useful_stats = []
-        for stat in stats:
-            _, stat_value = stat.split(":")
-            stat_value = float(stat_value)
-            if stat_value > 0:
-                useful_stats.append(stat)
+        # only the stats that are still positive once formatted
+        useful_stats = [f"{formatted_name}: {stat:.1f}"
+                        for formatted_name, stat in zip(STAT_LABELS, self.base_item_stats)
+                        if round(stat, 1) > 0]
         if self.is_passive_active:
             useful_stats.append(self.passive_name)
-        useful_stats = "\n".join(useful_stats)
-        return f"{self.name}: \n{useful_stats}"
+        return f"{self.name}: \n" + "\n".join(useful_stats)
 
 
-class BaseCharacter(abc.ABC):
+@lru_cache(maxsize=1024)
+def _calculate_item_effective_stats(item_type: type[BaseItem], base_item_stats: Stats,
+                                    is_passive_active: bool, character_stats: Stats) -> Stats:
+    """
+    Calculates the effective stats of an item of this class and state,
+    the same ones being recalculated every time a team is built.
+
+    Args:
+    	item_type (type[BaseItem]): The class of the item.
+    	base_item_stats (Stats): The base statistics associated with the item.
+    	is_passive_active (bool): The state indicating if the passive is active.
+    	character_stats (Stats): The original statistics of the character.
+
+    Returns:
+    	Stats: The calculated statistics after applying the item effect.
+    """
+    return item_type(base_item_stats, is_passive_active).calculate_effective_stats(character_stats)
+
+
+class BaseCharacter:
     """
 	BaseCharacter is an abstract base class for a character entity. It lays the
 	foundation for how a character should be structured in the context of this application
@@ -265,6 +457,9 @@ class BaseCharacter(abc.ABC):
 		added_item_stats (Stats): stats gained from items;
 		effective_stats (Stats): current stats after applying items;
 		items (list[BaseItem]): items held by the character
+
+	Like BaseItem, it is a plain class rather than an abc.ABC, its abstract
+	members raising NotImplementedError.
 	"""
     def __init__(self, base_stats: Stats) -> None:
         """
@@ -276,25 +471,50 @@ class BaseCharacter(abc.ABC):
         super().__init__()
         self.base_stats = base_stats
         self.added_item_stats = Stats()
-        self.effective_stats = self.base_stats
+        self._effective_stats = self.base_stats
         self.items = []
+        self._item_names = set()  # items are equal by name, for quick unique passive checks
         self.damage_stats = DamageStats()
 
     @property
-    @abc.abstractmethod
+    def effective_stats(self) -> Stats:
+        """
+        Returns the character's current stats after applying items and combat.
+        """
+        return self._effective_stats
+
+    @effective_stats.setter
+    def effective_stats(self, stats: Stats) -> None:
+        """
+        Updates the character's current stats. The cached attacks are built
+        from the physical and magic power, so they are only dropped when 
+        one of those changes: combat hp changes keep them cached.
+
+        Args:
+        	stats (Stats): the new effective stats of the character
+        """
+        previous_stats = self._effective_stats
+        if (stats.physical_power != previous_stats.physical_power 
+                or stats.magic_power != previous_stats.magic_power):
+            for attack_name in CACHED_ATTACKS:
+                self.__dict__.pop(attack_name, None)
+        self._effective_stats = stats
+
+    @property
     def name(self) -> str:
         """
-		Abstract property for the character's name.
+		Abstract property for the character's name, typically overridden
+		with a plain class attribute.
 		"""
-        pass
+        raise NotImplementedError
 
     @property
-    @abc.abstractmethod
     def special_attack_name(self) -> str:
         """
-        Abstract property for the character's special attack name.
+        Abstract property for the character's special attack name, typically
+        overridden with a plain class attribute.
         """
-        pass
+        raise NotImplementedError
 
     def add_item(self, item: BaseItem) -> None:
         """
@@ -317,14 +537,15 @@ class BaseCharacter(abc.ABC):
         if len(self.items) == N_ITEMS:
             raise ValueError("Attempted to add more items than allowed in game.")
 
-        if "Unique Passive" in item.passive_name and item in self.items:
+        if item.has_unique_passive and item.name in self._item_names:
             item.is_passive_active = False
 
         self.items.append(item)
-        self.added_item_stats = self.added_item_stats.add_stat_changes(
-            item.calculate_effective_stats(self.base_stats))
-        self.effective_stats = self.base_stats.add_stat_changes(
-            self.added_item_stats)
+        self._item_names.add(item.name)
+        item_stats = item.cached_effective_stats(self.base_stats)
+        self.added_item_stats = self.added_item_stats.add_stat_changes(item_stats)
+        # the effective stats take the new item on top, rather than being rebuilt from all the items
+        self.effective_stats = self.effective_stats.add_stat_changes(item_stats)
 
     def __str__(self) -> str:
         """
@@ -338,7 +559,7 @@ class BaseCharacter(abc.ABC):
             Returns:
                 str: A string representation of the BaseCharacter object.
         """
-        formatted_stats = str(self.effective_stats).replace("\n", "\n\t")
+        formatted_stats = self.effective_stats.format("\n\t")
         item_stats = ""
         for item_idx, item in enumerate(self.items):
             formatted_item_info = str(item).replace("\n", "\n\t\t\t")
@@ -350,7 +571,7 @@ class BaseCharacter(abc.ABC):
         return (f"{self.name}: \n\t{formatted_stats}" 
                 f"{formatted_item_stats}")
 
-    @property
+    @cached_property
     def basic_attack(self) -> Attack:
         """
         Creates a Basic Attack instance based on teh character's effective stats.
@@ -358,6 +579,8 @@ class BaseCharacter(abc.ABC):
 
         The damage done is impacted by the character's physical power. The return Attack
         instance encapsulates the damage done as well as a textual description of the action.
+        The attack is cached until the physical or magic power change, so hits taken 
+        in combat do not rebuild it.
 
         Returns:
         	Attack: An object representing the damage dealt by the attack
@@ -369,9 +592,11 @@ class BaseCharacter(abc.ABC):
         return Attack(damage=damage, description=description)
 
     @property
-    @abc.abstractmethod
     def special_attack(self) -> Attack:
         """
         Abstract property for the character's special attack.
+
+        Subclasses should implement it as a cached_property built from the
+        physical and magic power, which is invalidated whenever they change.
         """
-        pass
+        raise NotImplementedError
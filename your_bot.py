@@ -1,5 +1,7 @@
+from pathlib import Path
+import numpy as np
 from bot_utils import BaseBot
-from utils import BaseCharacter
+from utils import BaseCharacter, team_stats_array
 
 
 class YourBot(BaseBot):
@@ -8,24 +10,36 @@ class YourBot(BaseBot):
 	against the character that deals the most damage on the opponent's team.
 
 	Attributes:
-		opponent_damage_dealers (list[tuple[int, int]]): A list of tuples where each tuple contains the character
-														 index and the damage dealt by that character.
-		team_survivability (list[tuple[int, int]]): A list of tuples where each tuple contains the character
-													 index and the survivability score for that character
-													 (calculated as current HP + armor).
+		opponent_damage (np.ndarray): The damage dealt by each character of the opponent's team.
+		team_survivability (np.ndarray): The survivability score of each character of your team
+										 (calculated as current HP + armor).
 
 	Methods:
 		make_assignment(): Determines the position and items of each character in your team.
 		process_previous_round_stats(): Processes the stats of the previous round to set up new battles.
 	"""
+	__slots__ = ("opponent_damage", "team_survivability")
+
 	def __init__(self) -> None:
 		"""
-		Initializes an instance of YourBot, setting up lists for damage dealers and survivable characters.
+		Initializes an instance of YourBot, setting up arrays for damage dealers and survivable characters.
 		"""
-		self.opponent_damage_dealers = []
-		self.team_survivability = []
+		self.opponent_damage = np.empty(0, dtype=np.float64)
+		self.team_survivability = np.empty(0, dtype=np.float64)
 
-	def make_assignment(self) -> list[dict]:
+	def reset(self, assignment_dir: Path, persist_to_disk: bool = True) -> None:
+		"""
+		Gets the bot ready for a new match, also forgetting the stats of the previous match.
+
+		Args:
+			assignment_dir (Path): The directory of the blank team data of the new match.
+			persist_to_disk (bool): Whether the assignments are written to the assignment dir.
+		"""
+		super().reset(assignment_dir, persist_to_disk)
+		self.opponent_damage = np.empty(0, dtype=np.float64)
+		self.team_survivability = np.empty(0, dtype=np.float64)
+
+	def make_assignment(self) -> tuple[list[dict], list[dict]]:
 		"""
 		Creates assignments for each character on the team.
 
@@ -35,30 +49,33 @@ class YourBot(BaseBot):
 		the characters are assigned.
 
 		Returns:
-			list[dict]: A list of dictionaries where each dictionary represents character assignments.
+			tuple[list[dict], list[dict]]: A list of dictionaries where each dictionary represents character
+										   assignments, and the same list without the items.
 		"""
 
-		assignment = self.previous_character_ordering
-
-		if self.team_survivability:
-			previous_order = self.previous_character_ordering
-			self.team_survivability.sort(key=lambda x: x[1], reverse=True)
-			self.opponent_damage_dealers.sort(key=lambda x: x[1])
-
-			# Put the highest survivability character to combat against the highest damage dealer
-			high_survivability_char_idx, _ = self.team_survivability[0]
-			high_damage_oppo_char_idx, _ = self.opponent_damage_dealers[-1]
-			assignment[high_damage_oppo_char_idx] = previous_order[high_survivability_char_idx]
-
-			for i in range(1, len(self.team_survivability)):
-				team_char_idx, _ = self.team_survivability[i]
-				placement_idx, _ = self.opponent_damage_dealers[i - 1]
+		# one copy of the previous ordering to read from, another one to place the characters in
+		previous_order = self.previous_character_ordering
+		assignment = previous_order.copy()
+		character_ordering = assignment
+		team_survivability = self.team_survivability
+		opponent_damage = self.opponent_damage
+
+		if team_survivability.size:
+			# stable sorts, so that ties keep their team order
+			team_order = np.argsort(-team_survivability, kind="stable").tolist()
+			# Put the highest survivability character to combat against the highest damage dealer,
+			# then the others against the rest of the opponents from the lowest damage dealer up
+			placement_order = np.roll(np.argsort(opponent_damage, kind="stable"), 1).tolist()
+			high_damage_oppo_char_idx = placement_order[0]
+
+			for team_char_idx, placement_idx in zip(team_order, placement_order):
 				assignment[placement_idx] = previous_order[team_char_idx]
 
 			# Give the items to the character that holds position against the highest damage dealer
-			assignment[high_damage_oppo_char_idx]["items"] = self.items
+			character_ordering = list(assignment)
+			assignment[high_damage_oppo_char_idx] = {**assignment[high_damage_oppo_char_idx], "items": self.items}
 
-		return assignment
+		return assignment, character_ordering
 
 	def process_previous_round_stats(self,
 									 is_your_win: bool,
@@ -77,7 +94,7 @@ class YourBot(BaseBot):
 												 the next round.
 		"""
 
-		self.opponent_damage_dealers = [(char_idx, char.damage_stats.damage_dealt)
-										for char_idx, char in enumerate(opponent_team)]
-		self.team_survivability = [(char_idx, char.effective_stats.current_hp + char.effective_stats.armor)
-								   for char_idx, char in enumerate(your_team)]
+		self.opponent_damage = np.fromiter((char.damage_stats.damage_dealt for char in opponent_team),
+										   dtype=np.float64, count=len(opponent_team))
+		team_stats = team_stats_array(your_team)
+		self.team_survivability = team_stats["current_hp"] + team_stats["armor"]